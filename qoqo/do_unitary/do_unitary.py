@@ -28,6 +28,8 @@ from typing import (
     List,
     Dict,
     Optional,
+    Tuple,
+    FrozenSet,
     cast,
     Any
 )
@@ -51,6 +53,10 @@ class DoUnitary(object):
        qoqo.measurements.basis_rotation_measurements.py.
     """
 
+    __slots__ = ('_measurement', '_circuit_list', '_backend', '_free_parameters', '_device',
+                 '_run_measurement', '_resume_file_name', '_resume_call_parameters',
+                 'call_parameters', '_free_parameters_set')
+
     _qonfig_defaults_dict: Dict[str, Dict[str, Any]] = {
         'device': {
             'doc': ('A qoqo device specification giving the available gates, '
@@ -115,7 +121,7 @@ class DoUnitary(object):
         self._measurement.backend = None
         config['measurement'] = self._measurement.to_qonfig()
         self._measurement.backend = self._backend
-        config['free_parameters'] = self._free_parameters
+        config['free_parameters'] = list(self._free_parameters)
         if self._device is None:
             config['device'] = None
         else:
@@ -149,7 +155,8 @@ class DoUnitary(object):
         self._measurement = measurement
         self._circuit_list = self._measurement.circuit_list
         self._backend = backend
-        self._free_parameters = free_parameters
+        self._free_parameters: Tuple[str, ...] = tuple(free_parameters)
+        self._free_parameters_set: FrozenSet[str] = frozenset(free_parameters)
         self._device = device
         self._backend.device = device
         self._measurement.backend = self._backend
@@ -158,6 +165,15 @@ class DoUnitary(object):
         self._resume_file_name: Optional[str] = resume_file_name
         self._resume_call_parameters: Optional[Dict[str, float]] = resume_call_parameters
 
+    @property
+    def _backend_cached(self) -> Optional[BackendBaseClass]:
+        """Return the backend used by the measurement
+
+        Returns:
+            Optional[BackendBaseClass]
+        """
+        return self._measurement.backend
+
     def __call__(self,
                  parameters: Optional[Union[List[float], Dict['str', float]]] = None,
                  ) -> pd.Series:
@@ -185,12 +201,10 @@ class DoUnitary(object):
 
         if isinstance(parameters, dict):
             parameter_substitution_dict = parameters
-            if any([name not in parameter_substitution_dict.keys()
-                    for name in self._free_parameters]):
+            if not self._free_parameters_set.issubset(parameter_substitution_dict.keys()):
                 raise ValueError("All parameters of the unitary time evolution must be set")
         else:
-            for name, p in zip(self._free_parameters, parameters):
-                parameter_substitution_dict[name] = p
+            parameter_substitution_dict = dict(zip(self._free_parameters, parameters))
 
         if self._resume_file_name is not None:
             self._resume_call_parameters = parameter_substitution_dict
@@ -208,7 +222,6 @@ class DoUnitary(object):
                 resume_config.save_to_yaml(self._resume_file_name,
                                            overwrite=False)
             return None
-        self._backend_cached = self._measurement._backend
         if not parameter_substitution_dict:
             parameter_series = pd.Series({}, dtype=complex)
         else:
@@ -14,14 +14,37 @@ from typing import (
     List,
     Optional,
     Dict,
+    Any,
+    TYPE_CHECKING,
 )
 import numpy as np
 from hqsbase.qonfig import Qonfig
-import scipy.sparse as sp
+if TYPE_CHECKING:
+    import scipy.sparse as sp
 
 DEFAULT_PP_TO_EXP_VAL_MATRIX = np.zeros((0, 0))
 
 
+def _import_sparse() -> Any:
+    """Import scipy.sparse when it is first needed
+
+    scipy is an optional dependency of qoqo that is only required for the sparse
+    operator matrices of the PurePragmaMeasurementInput.
+
+    Returns:
+        Any: The scipy.sparse module
+
+    Raises:
+        ImportError: scipy is not installed
+    """
+    try:
+        import scipy.sparse as sparse
+    except ImportError as error:
+        raise ImportError('PurePragmaMeasurementInput requires scipy. '
+                          + 'Install it with "pip install qoqo[sparse]"') from error
+    return sparse
+
+
 class BRMeasurementInput(object):
     """Necessary Information to run a BasisRotationMeasurement.
 
@@ -273,7 +296,7 @@ class PurePragmaMeasurementInput(object):
     _qonfig_never_receives_values = True
 
     def __init__(self,
-                 operator_matrices: Optional[Dict[str, Dict[str, sp.spmatrix]]] = None,
+                 operator_matrices: Optional[Dict[str, Dict[str, 'sp.spmatrix']]] = None,
                  use_density_matrix: bool = False,
                  ) -> None:
         """Initialize PurePragmaMeasurementInput
@@ -283,7 +306,7 @@ class PurePragmaMeasurementInput(object):
             use_density_matrix: Use density matrix in simulator backend
         """
         if operator_matrices is None:
-            self.operator_matrices: Dict[str, Dict[str, sp.spmatrix]] = dict()
+            self.operator_matrices: Dict[str, Dict[str, 'sp.spmatrix']] = dict()
         else:
             self.operator_matrices = operator_matrices
         self.use_density_matrix = use_density_matrix
@@ -300,8 +323,9 @@ class PurePragmaMeasurementInput(object):
         Returns:
             PurePragmaMeasurementInput
         """
+        sparse = _import_sparse()
         # Reconstructing operator matrices
-        operator_matrices: Dict[str, sp.spmatrix] = dict()
+        operator_matrices: Dict[str, 'sp.spmatrix'] = dict()
         dim: int = config['operator_matrices_dim']
         real_dict: Dict[str, Dict[str, List[float]]] = config['operator_matrices_real_data']
         imag_dict: Dict[str, Dict[str, List[float]]] = config['operator_matrices_imag_data']
@@ -317,8 +341,8 @@ class PurePragmaMeasurementInput(object):
                 val_indices = readout_dict_indices[key]
                 val_indptr = readout_dict_indptr[key]
                 operator_matrices[readout_key][key] = (
-                    sp.csr_matrix((val_real, val_indices, val_indptr), (dim, dim))
-                    + 1j * sp.csr_matrix((val_imag, val_indices, val_indptr), (dim, dim)))
+                    sparse.csr_matrix((val_real, val_indices, val_indptr), (dim, dim))
+                    + 1j * sparse.csr_matrix((val_imag, val_indices, val_indptr), (dim, dim)))
         return cls(
             operator_matrices=operator_matrices,
             use_density_matrix=config['use_density_matrix']
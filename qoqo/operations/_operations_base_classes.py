@@ -225,6 +225,20 @@ class Operation():
         """
         pass
 
+    def remapped(self,
+                 mapping_dict: Dict[int, int]) -> 'Operation':
+        r"""Return a copy of the operation with remapped qubits
+
+        Args:
+            mapping_dict: Dict containing mapping old qubit indices to new qubit indices
+
+        Returns:
+            Operation
+        """
+        operation = copy(self)
+        operation.remap_qubits(mapping_dict)
+        return operation
+
     @property
     def involved_qubits(self) -> Set[Union[int, str]]:
         """Return the qubits involved in the operation
@@ -885,7 +885,6 @@ class PragmaRepeatedMeasurement(Pragma):
             return False
         if not (self._qubit_mapping
                 == other._qubit_mapping):
-            print('here')
             return False
         return True
 
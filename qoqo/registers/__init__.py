@@ -24,6 +24,7 @@ qoqo circuit and to provide a unified output interface for the different backend
     FloatRegisterOutput
     ComplexRegisterOutput
     RegisterOutput
+    RegisterStore
     add_register
 
 """
@@ -36,5 +37,6 @@ from qoqo.registers.registers import (
     FloatRegisterOutput,
     ComplexRegisterOutput,
     RegisterOutput,
+    RegisterStore,
     add_register,
 )
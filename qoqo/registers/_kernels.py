@@ -0,0 +1,53 @@
+# Copyright © 2019-2021 HQS Quantum Simulations GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied. See the License for the specific language governing permissions and limitations under
+# the License.
+"""Compiled kernels for the classical registers
+
+When numba is installed the kernels are compiled in nopython mode,
+otherwise a numpy implementation with the same behaviour is used.
+"""
+from typing import Callable
+import numpy as np
+
+
+def _write_register_numpy(register: np.ndarray,
+                          indices: np.ndarray,
+                          values: np.ndarray) -> None:
+    """Write values into register at the given indices using numpy fancy indexing
+
+    Args:
+        register: Register array that is written to
+        indices: Indices in the register that are written
+        values: Values that are written to the register
+    """
+    register[indices] = values
+
+
+def _write_register_loop(register: np.ndarray,
+                         indices: np.ndarray,
+                         values: np.ndarray) -> None:
+    """Write values into register at the given indices element by element
+
+    Args:
+        register: Register array that is written to
+        indices: Indices in the register that are written
+        values: Values that are written to the register
+    """
+    for i in range(indices.shape[0]):
+        register[indices[i]] = values[i]
+
+
+write_register: Callable[[np.ndarray, np.ndarray, np.ndarray], None]
+try:
+    from numba import njit
+    write_register = njit(cache=True)(_write_register_loop)
+except ImportError:
+    write_register = _write_register_numpy
@@ -13,12 +13,19 @@
 from qoqo.operations import (
     Definition
 )
-from typing import Union, List, Dict
+from qoqo.registers._kernels import write_register
+from typing import Union, List, Dict, Sequence, Tuple, Optional, cast
 import numpy as np
 
 
 class BitRegister(object):
-    """Bit register in the qoqo backends"""
+    """Bit register in the qoqo backends
+
+    The bits are stored unpacked in the bool array register. to_packed returns them packed
+    eight bits per byte, for example to store or transfer many shots compactly.
+    """
+
+    __slots__ = ('vartype', 'name', 'length', 'is_output', 'register')
 
     def __init__(self, definition: Definition) -> None:
         """Initialize Register
@@ -35,16 +42,77 @@ class BitRegister(object):
         self.name: str = definition._name
         self.length: int = definition._length
         self.is_output: bool = definition._is_output
-        self.register: List[bool] = [False for i in range(self.length)]
+        self.register: np.ndarray = np.zeros((self.length,), dtype=bool)
 
     def reset(self) -> None:
         """Reset internal register"""
-        self.register = [False for i in range(self.length)]
+        self.register = np.zeros((self.length,), dtype=bool)
+
+    def __len__(self) -> int:
+        """Return number of bits in the register
+
+        Returns:
+            int
+        """
+        return self.length
+
+    def __getitem__(self, index: int) -> bool:
+        """Return the bit at index
+
+        Args:
+            index: Index of the bit in the register
+
+        Returns:
+            bool
+        """
+        return bool(self.register[index])
+
+    def __setitem__(self, index: int, value: bool) -> None:
+        """Set the bit at index
+
+        Args:
+            index: Index of the bit in the register
+            value: New value of the bit
+        """
+        self.register[index] = value
+
+    def to_bool_array(self) -> np.ndarray:
+        """Return a copy of the bits of the register
+
+        Returns:
+            np.ndarray
+        """
+        return self.register.copy()
+
+    def to_packed(self) -> np.ndarray:
+        """Return the bits packed eight per byte
+
+        Bit i is stored in bit (i % 8) of byte (i // 8) of the returned np.uint8 array.
+
+        Returns:
+            np.ndarray
+        """
+        return np.packbits(self.register, bitorder='little')
+
+    def write_batch(self, indices: Sequence[int], values: Sequence[bool]) -> None:
+        """Write several values into the register at once
+
+        Args:
+            indices: Indices in the register that are written
+            values: Values written to the register at the corresponding indices
+
+        Raises:
+            ValueError: Number of indices and values different
+            IndexError: Index out of range of the register
+        """
+        _write_batch(self.register, indices, values)
 
 
 class FloatRegister(object):
     """Float register in the qoqo backends"""
 
+    __slots__ = ('vartype', 'name', 'length', 'is_output', 'register')
+
     def __init__(self, definition: Definition) -> None:
         """Initialize Register
 
@@ -60,16 +128,31 @@ class FloatRegister(object):
         self.name: str = definition._name
         self.length: int = definition._length
         self.is_output: bool = definition._is_output
-        self.register: List[float] = [0 for i in range(self.length)]
+        self.register: np.ndarray = np.zeros((self.length,), dtype=float)
 
     def reset(self) -> None:
         """Reset internal register"""
-        self.register = [0 for i in range(self.length)]
+        self.register = np.zeros((self.length,), dtype=float)
+
+    def write_batch(self, indices: Sequence[int], values: Sequence[float]) -> None:
+        """Write several values into the register at once
+
+        Args:
+            indices: Indices in the register that are written
+            values: Values written to the register at the corresponding indices
+
+        Raises:
+            ValueError: Number of indices and values different
+            IndexError: Index out of range of the register
+        """
+        _write_batch(self.register, indices, values)
 
 
 class ComplexRegister(object):
     """Complex register in the qoqo backends"""
 
+    __slots__ = ('vartype', 'name', 'length', 'is_output', 'register')
+
     def __init__(self, definition: Definition) -> None:
         """Initialize Register
 
@@ -91,22 +174,116 @@ class ComplexRegister(object):
         """Reset internal register"""
         self.register = np.zeros((self.length,), dtype=complex)
 
+    def write_batch(self, indices: Sequence[int], values: Sequence[complex]) -> None:
+        """Write several values into the register at once
+
+        Args:
+            indices: Indices in the register that are written
+            values: Values written to the register at the corresponding indices
+
+        Raises:
+            ValueError: Number of indices and values different
+            IndexError: Index out of range of the register
+        """
+        _write_batch(self.register, indices, values)
+
+
+def _write_batch(register: np.ndarray,
+                 indices: Sequence[int],
+                 values: Sequence[Union[bool, float, complex]]) -> None:
+    """Write several values into a register array at once
+
+    Args:
+        register: Register array that is written to
+        indices: Indices in the register that are written
+        values: Values written to the register at the corresponding indices
+
+    Raises:
+        ValueError: Number of indices and values different
+        IndexError: Index out of range of the register
+    """
+    index_array = np.asarray(indices, dtype=np.int64)
+    value_array = np.asarray(values, dtype=register.dtype)
+    if index_array.shape != value_array.shape:
+        raise ValueError('Number of indices and values different')
+    # The compiled kernel does not check bounds, invalid indices would write past the array
+    if index_array.size > 0 and (index_array.min() < 0
+                                 or index_array.max() >= register.shape[0]):
+        raise IndexError('Index out of range of the register')
+    write_register(register, index_array, value_array)
+
+
+_OUTPUT_DTYPES: Dict[str, type] = {'bit': bool, 'float': float, 'complex': complex}
+
 
 class RegisterOutput(object):
-    """Output register in the qoqo backends"""
+    """Output register in the qoqo backends
 
-    def __init__(self, definition: Definition) -> None:
+    By default the register is a list that grows by one entry per appended shot.
+    When the number of shots is known in advance (expected_shots > 0) the shots are written
+    into the rows of a preallocated numpy array of shape (expected_shots, length). register
+    then only returns the rows up to the last written shot (see size), rows that were never
+    written are not part of the results.
+    """
+
+    __slots__ = ('vartype', 'name', 'length', '_register', '_shots')
+
+    def __init__(self, definition: Definition, expected_shots: int = 0) -> None:
         """Initialize OutputRegister
 
         Args:
             definition: Define operation creating output register
+            expected_shots: Number of shots for which the register is preallocated,
+                            0 for a growing list
         """
         self.name: str = ''
         self.vartype: str = ''
         self.length: int = 0
-        self.register: List = list()
+        self._register: Union[List, np.ndarray] = list()
+        self._shots: Optional[int] = None
         pass
 
+    @property
+    def register(self) -> Union[List, np.ndarray]:
+        """Return the shots written to the output register so far
+
+        For a preallocated register this is a view of the first size rows of the preallocated
+        array, rows after the highest written shot index are not included.
+
+        Returns:
+            Union[List, np.ndarray]: list of shots, or view of the written rows of the
+                                     preallocated array
+        """
+        if self._shots is not None:
+            return self._register[:self._shots]
+        return self._register
+
+    @register.setter
+    def register(self, register: Union[List, np.ndarray]) -> None:
+        """Replace the shots in the output register, the register is no longer preallocated
+
+        Args:
+            register: New shots of the output register
+        """
+        self._register = register
+        self._shots = None
+
+    def _preallocate(self, expected_shots: int) -> None:
+        """Preallocate the register for a known number of shots
+
+        The dtype of the preallocated array is given by the vartype of the register.
+
+        Args:
+            expected_shots: Number of shots, 0 keeps the register a growing list
+        """
+        if expected_shots > 0:
+            self._register = np.zeros((expected_shots, self.length),
+                                      dtype=_OUTPUT_DTYPES[self.vartype])
+            self._shots = 0
+        else:
+            self._register = list()
+            self._shots = None
+
     def __len__(self) -> int:
         """Return length of OutputRegister
 
@@ -122,25 +299,85 @@ class RegisterOutput(object):
         Returns:
             int
         """
-        return len(self.register)
+        if self._shots is not None:
+            return self._shots
+        return len(self._register)
 
-    def append(self, register: Union[BitRegister, FloatRegister, ComplexRegister]) -> None:
-        """Append content of register to output register
+    def _check_compatible(self, register: Union[BitRegister, FloatRegister, ComplexRegister],
+                          action: str) -> None:
+        """Check that register can be added to the output register
 
         Args:
-            register: Register that is appended to the output register
+            register: Register that is added to the output register
+            action: Name of the action used in the error message
 
         Raises:
-            TypeError: Output register and appended register not compatible.
+            TypeError: Output register and register not compatible.
                        Name, vartype of length different.
         """
         if (self.name != register.name
                 or self.vartype != register.vartype
                 or self.length != register.length):
             raise TypeError(
-                "Output register and appended register not compatible. "
+                "Output register and {} register not compatible. ".format(action)
                 + "Name, vartype of length different.")
-        self.register.append(register.register)
+
+    def write(self,
+              shot_index: int,
+              register: Union[BitRegister, FloatRegister, ComplexRegister]) -> None:
+        """Write content of register into a shot of the preallocated output register
+
+        Afterwards register returns all shots up to and including shot_index, earlier shots
+        that were not written yet are zero.
+
+        Args:
+            shot_index: Index of the shot that is written
+            register: Register that is written to the output register
+
+        Raises:
+            TypeError: Output register is not preallocated
+            IndexError: Shot index out of range of the preallocated register
+        """
+        self._check_compatible(register, 'written')
+        self._write_shot(shot_index, register)
+
+    def _write_shot(self,
+                    shot_index: int,
+                    register: Union[BitRegister, FloatRegister, ComplexRegister]) -> None:
+        """Write content of a compatible register into a shot of the preallocated register
+
+        Unlike write, the compatibility of register is not checked.
+
+        Args:
+            shot_index: Index of the shot that is written
+            register: Register that is written to the output register
+
+        Raises:
+            TypeError: Output register is not preallocated
+            IndexError: Shot index out of range of the preallocated register
+        """
+        if self._shots is None:
+            raise TypeError('Output register is not preallocated')
+        if not 0 <= shot_index < len(self._register):
+            raise IndexError('Shot index out of range of the preallocated register')
+        self._register[shot_index] = register.register
+        self._shots = max(self._shots, shot_index + 1)
+
+    def append(self, register: Union[BitRegister, FloatRegister, ComplexRegister]) -> None:
+        """Append content of register to output register
+
+        Args:
+            register: Register that is appended to the output register
+
+        Raises:
+            TypeError: Output register and appended register not compatible.
+                       Name, vartype of length different.
+        """
+        self._check_compatible(register, 'appended')
+        if self._shots is not None:
+            self._write_shot(self._shots, register)
+        else:
+            cast(List, self._register).append(register.register)
 
     def extend(self, register: Union[BitRegister, FloatRegister, ComplexRegister]) -> None:
         """Extend output register with content of register
@@ -152,23 +389,24 @@ class RegisterOutput(object):
             TypeError: Output register and extended register not compatible.
                        Name, vartype of length different.
         """
-        if (self.name != register.name
-                or self.vartype != register.vartype
-                or self.length != register.length):
-            raise TypeError(
-                "Output register and extended register not compatible. "
-                + "Name, vartype of length different.")
-        self.register.extend(register.register)
+        self._check_compatible(register, 'extended')
+        if self._shots is not None:
+            raise TypeError('Preallocated output register can only be appended to')
+        cast(List, self._register).extend(register.register)
 
 
 class BitRegisterOutput(RegisterOutput):
     """Output BitRegister in the qoqo backends"""
 
-    def __init__(self, definition: Definition) -> None:
+    __slots__ = ()
+
+    def __init__(self, definition: Definition, expected_shots: int = 0) -> None:
         """Initialize OutputRegister
 
         Args:
             definition: Define operation creating output register
+            expected_shots: Number of shots for which the register is preallocated,
+                            0 for a growing list
 
         Raises:
             TypeError: BitRegister can only be initialized by bit Definition
@@ -180,17 +418,21 @@ class BitRegisterOutput(RegisterOutput):
         self.vartype: str = 'bit'
         self.name: str = definition._name
         self.length: int = definition._length
-        self.register: List[List[bool]] = list()
+        self._preallocate(expected_shots)
 
 
 class FloatRegisterOutput(RegisterOutput):
     """Output FloatRegister in the qoqo backends"""
 
-    def __init__(self, definition: Definition) -> None:
+    __slots__ = ()
+
+    def __init__(self, definition: Definition, expected_shots: int = 0) -> None:
         """Initialize OutputRegister
 
         Args:
             definition: Define operation creating output register
+            expected_shots: Number of shots for which the register is preallocated,
+                            0 for a growing list
 
         Raises:
             TypeError: FloatRegister can only be initialized by float Definition
@@ -202,17 +444,21 @@ class FloatRegisterOutput(RegisterOutput):
         self.vartype: str = 'float'
         self.name: str = definition._name
         self.length: int = definition._length
-        self.register: List[List[float]] = list()
+        self._preallocate(expected_shots)
 
 
 class ComplexRegisterOutput(RegisterOutput):
     """Output ComplexRegister in the qoqo backends"""
 
-    def __init__(self, definition: Definition) -> None:
+    __slots__ = ()
+
+    def __init__(self, definition: Definition, expected_shots: int = 0) -> None:
         """Initialize OutputRegister
 
         Args:
             definition: Define operation creating output register
+            expected_shots: Number of shots for which the register is preallocated,
+                            0 for a growing list
 
         Raises:
             TypeError: ComplexRegister can only be initialized by complex Definition
@@ -224,28 +470,101 @@ class ComplexRegisterOutput(RegisterOutput):
         self.vartype: str = 'complex'
         self.name: str = definition._name
         self.length: int = definition._length
-        self.register: List[List[float]] = list()
+        self._preallocate(expected_shots)
 
 
 def add_register(register_dict: Dict[str, Union[BitRegister, FloatRegister, ComplexRegister]],
                  output_dict: Dict[str, RegisterOutput],
-                 definition: Definition) -> None:
+                 definition: Definition,
+                 expected_shots: Optional[int] = None) -> None:
     """Add register to register dict and output register dict
 
     Args:
         register_dict: Dict of all internal registers in the calculator
         output_dict: Dict of all output registers
         definition: Define operation defining new register
+        expected_shots: Number of shots the output register is preallocated for,
+                        for example the number_measurements of a PragmaRepeatedMeasurement.
+                        None for an output register growing with each shot.
     """
+    shots = 0 if expected_shots is None else expected_shots
     if definition._vartype == 'bit':
         register_dict[definition._name] = BitRegister(definition)
         if definition._is_output:
-            output_dict[definition._name] = BitRegisterOutput(definition)
+            output_dict[definition._name] = BitRegisterOutput(definition, shots)
     if definition._vartype == 'float':
         register_dict[definition._name] = FloatRegister(definition)
         if definition._is_output:
-            output_dict[definition._name] = FloatRegisterOutput(definition)
+            output_dict[definition._name] = FloatRegisterOutput(definition, shots)
     if definition._vartype == 'complex':
         register_dict[definition._name] = ComplexRegister(definition)
         if definition._is_output:
-            output_dict[definition._name] = ComplexRegisterOutput(definition)
+            output_dict[definition._name] = ComplexRegisterOutput(definition, shots)
+
+
+class RegisterStore(object):
+    """Storage for all internal registers in the qoqo backends
+
+    The registers are stored grouped by vartype: each of the bit, float and complex dicts maps
+    the register names to one numpy array of the corresponding dtype.
+    The meta dict maps each register name to its (vartype, length, is_output).
+    """
+
+    __slots__ = ('bit', 'float', 'complex', 'meta')
+
+    def __init__(self) -> None:
+        """Initialize empty RegisterStore"""
+        self.bit: Dict[str, np.ndarray] = dict()
+        self.float: Dict[str, np.ndarray] = dict()
+        self.complex: Dict[str, np.ndarray] = dict()
+        self.meta: Dict[str, Tuple[str, int, bool]] = dict()
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return the register array with the given name
+
+        Args:
+            name: Name of the register
+
+        Returns:
+            np.ndarray
+        """
+        vartype = self.meta[name][0]
+        return getattr(self, vartype)[name]
+
+    def __contains__(self, name: object) -> bool:
+        """Return True when the store contains a register with the given name
+
+        Args:
+            name: Name of the register
+
+        Returns:
+            bool
+        """
+        return name in self.meta
+
+    def add(self, definition: Definition) -> None:
+        """Add register defined by definition to the store
+
+        Args:
+            definition: Define operation defining new register
+        """
+        if definition._vartype == 'bit':
+            self.bit[definition._name] = np.zeros((definition._length,), dtype=bool)
+        elif definition._vartype == 'float':
+            self.float[definition._name] = np.zeros((definition._length,), dtype=float)
+        elif definition._vartype == 'complex':
+            self.complex[definition._name] = np.zeros((definition._length,), dtype=complex)
+        else:
+            return
+        self.meta[definition._name] = (definition._vartype,
+                                       definition._length,
+                                       definition._is_output)
+
+    def reset(self) -> None:
+        """Reset all registers in the store"""
+        for bit_array in self.bit.values():
+            bit_array.fill(False)
+        for float_array in self.float.values():
+            float_array.fill(0)
+        for complex_array in self.complex.values():
+            complex_array.fill(0)
@@ -29,11 +29,27 @@ __version__ = lines[-1].strip().split("'")[1].strip()
 install_requires = [
     'hqsbase>=0.7.5',
     'numpy',
-    'scipy',
     'networkx',
     'pandas'
 ]
 
+extras_require = {
+    'jit': ['numba'],
+    'sparse': ['scipy'],
+}
+
+# Optionally compile the pure python glue modules on the hot path with Cython.
+# The python sources remain the fallback when QOQO_CYTHONIZE is not set.
+ext_modules = []
+if os.environ.get('QOQO_CYTHONIZE', '0') == '1':
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ['qoqo/registers/registers.py',
+         'qoqo/do_unitary/do_unitary.py'],
+        compiler_directives={'language_level': 3,
+                             'binding': True,
+                             'embedsignature': True})
+
 authors = 'HQS Quantum Simulations'
 
 setup(name='qoqo',
@@ -47,4 +63,6 @@ setup(name='qoqo',
       license=License,
       python_requires='>=3.7',
       install_requires=install_requires,
+      extras_require=extras_require,
+      ext_modules=ext_modules,
       )
@@ -16,16 +16,22 @@ import sys
 import numpy.testing as npt
 from qoqo import operations as ops
 from qoqo import Circuit
-from typing import Any
-from hqsbase.qonfig import Qonfig
-from copy import deepcopy
+from typing import Any, Callable
+from copy import copy, deepcopy
 
 
-def test_to_hqs_lang() -> None:
-    """Test export import to HQS-Quil"""
+@pytest.fixture(scope='module')
+def base_circuit() -> Circuit:
+    """Circuit prefix shared by the tests, each test works on a copy"""
     circuit = Circuit()
     circuit += ops.Definition(name='ro', vartype='bit', length=1)
     circuit += ops.Hadamard(qubit=0)
+    return circuit
+
+
+def test_to_hqs_lang(base_circuit: Circuit) -> None:
+    """Test export import to HQS-Quil"""
+    circuit = copy(base_circuit)
     circuit += ops.Definition(name='test', vartype='float', length=3)
     circuit += ops.MeasureQubit(qubit=0, readout='ro', readout_index='0')
     lines = circuit.to_hqs_lang()
@@ -97,13 +103,11 @@ def test_getitem_setitem_delitem() -> None:
     assert circuit[1] == ops.Definition('test', 'float', 1, False, False)
 
 
-def test_circuit_sequence_methods() -> None:
+def test_circuit_sequence_methods(base_circuit: Circuit) -> None:
     """Test magick methods implementing sequence interface in circuit"""
-    circuit1 = Circuit()
+    circuit1 = copy(base_circuit)
     circuit2 = Circuit()
 
-    circuit1 += ops.Definition(name='ro', vartype='bit', length=1)
-    circuit1 += ops.Hadamard(qubit=0)
     circuit1 += ops.MeasureQubit(qubit=0, readout='ro', readout_index='0')
     npt.assert_equal(circuit1[1], ops.Hadamard(qubit=0))
     circuit2 += ops.Definition(name='ro', vartype='bit', length=1)
@@ -116,11 +120,9 @@ def test_circuit_sequence_methods() -> None:
 
 
 @pytest.mark.parametrize("gates_only", [True, False])
-def test_get_operation_types(gates_only: bool) -> None:
+def test_get_operation_types(base_circuit: Circuit, gates_only: bool) -> None:
     """Test getting type of operations in circuit"""
-    circuit = Circuit()
-    circuit += ops.Definition(name='ro', vartype='bit', length=1)
-    circuit += ops.Hadamard(qubit=0)
+    circuit = copy(base_circuit)
     circuit += ops.CNOT(qubit=0, control=1)
     circuit += ops.GivensRotationLittleEndian(qubit=0, control=1)
     circuit += ops.PMInteraction(i=0, j=1)
@@ -142,7 +144,7 @@ def test_get_operation_types(gates_only: bool) -> None:
             assert t in list_types
 
 
-def test_substitution() -> None:
+def test_substitution(roundtrip: Callable[[Any], Any]) -> None:
     """Test parameter substitution in circuit"""
 
     Theta = 'theta'
@@ -176,7 +178,7 @@ def test_substitution() -> None:
 
     assert circuit == circuit2
 
-    circuit3 = _serialisation_convertion(circuit)
+    circuit3 = roundtrip(circuit)
     assert circuit3 == circuit
 
 
@@ -209,26 +211,5 @@ def test_remap_qubits() -> None:
     assert circuit == circuit_test
 
 
-def _serialisation_convertion(to_conv: Qonfig[Any]) -> Any:
-    """Convertion function for all serialisation unittests
-
-    Takes the object input, serialises and deserialises it, returning the deserialised
-    version. The original object and the manipulated one are then compared in the unittest
-    script to assert that the serialisation worked correctly.
-
-    Args:
-        to_conv: object to be serialised and deserialised
-
-    Returns:
-        Any: deserialised object
-    """
-    config = to_conv.to_qonfig()
-    json = config.to_json()
-    config2 = Qonfig.from_json(json)
-    converted = config2.to_instance()
-
-    return converted
-
-
 if __name__ == '__main__':
     pytest.main(sys.argv)
@@ -0,0 +1,106 @@
+# Copyright © 2019-2021 HQS Quantum Simulations GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied. See the License for the specific language governing permissions and limitations under
+# the License.
+"""Shared fixtures for the qoqo unittests"""
+
+import pytest
+from typing import Any, Callable, List
+from hqsbase.qonfig import Qonfig
+from qoqo import Circuit
+
+
+def pytest_addoption(parser: Any) -> None:
+    """Add the --runslow option to the pytest command line"""
+    parser.addoption('--runslow', action='store_true', default=False,
+                     help='run the tests marked as slow')
+
+
+def pytest_configure(config: Any) -> None:
+    """Register the markers used by the qoqo unittests"""
+    config.addinivalue_line('markers', 'slow: slow test, only run with --runslow')
+
+
+def pytest_collection_modifyitems(config: Any, items: List[Any]) -> None:
+    """Skip the tests marked as slow unless --runslow is given"""
+    if config.getoption('--runslow'):
+        return
+    skip_slow = pytest.mark.skip(reason='needs --runslow option to run')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def _serialisation_convertion(to_conv: Any) -> Any:
+    """Convertion function for all serialisation unittests
+
+    Takes the object input, serialises and deserialises it, returning the deserialised
+    version. The original object and the manipulated one are then compared in the unittest
+    script to assert that the serialisation worked correctly.
+
+    Args:
+        to_conv: object to be serialised and deserialised
+
+    Returns:
+        Any: deserialised object
+    """
+    config = to_conv.to_qonfig()
+    json = config.to_json()
+    config2 = Qonfig.from_json(json)
+    converted = config2.to_instance()
+
+    return converted
+
+
+def _dict_convertion(to_conv: Any) -> Any:
+    """Round trip an object through the dictionary of its Qonfig
+
+    Cheaper than _serialisation_convertion, no json is created or parsed. Used by the
+    operation unittests, which check the json representation separately.
+    The dictionary is made yaml compatible like for json, numpy arrays become lists that
+    Qonfig.from_dict can restore.
+
+    Args:
+        to_conv: object to be converted and restored
+
+    Returns:
+        Any: restored object
+    """
+    config2 = Qonfig.from_dict(to_conv.to_qonfig().to_dict(enforce_yaml_compatible=True))
+    return config2.to_instance()
+
+
+@pytest.fixture
+def roundtrip() -> Callable[[Any], Any]:
+    """Return the serialisation round trip function shared by the unittests"""
+    return _serialisation_convertion
+
+
+@pytest.fixture
+def dict_roundtrip() -> Callable[[Any], Any]:
+    """Return the Qonfig dictionary round trip function shared by the operation unittests"""
+    return _dict_convertion
+
+
+@pytest.fixture(scope='session')
+def _pyquest_backend_session() -> Any:
+    """Create the PyQuestBackend shared by all tests of the session"""
+    pyquest = pytest.importorskip('qoqo_pyquest')
+    return pyquest.PyQuestBackend(number_qubits=2)
+
+
+@pytest.fixture
+def pyquest_backend(_pyquest_backend_session: Any) -> Any:
+    """Return the shared two qubit PyQuestBackend reset to an empty circuit"""
+    backend = _pyquest_backend_session
+    backend.circuit = Circuit()
+    backend.substitution_dict = None
+    backend.device = None
+    return backend
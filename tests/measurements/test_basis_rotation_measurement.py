@@ -19,20 +19,18 @@ from qoqo import operations as ops
 from qoqo import Circuit
 from qoqo import measurements
 from hqsbase import qonfig
-from hqsbase.qonfig import Qonfig
-from typing import Any
-
-PAULI_PRODUCT_QUBIT_MASKS = dict()
-PAULI_PRODUCT_QUBIT_MASKS['test1'] = {0: list(), 1: [0,1]}
-PAULI_PRODUCT_QUBIT_MASKS['test2'] = {2: [0], 3: [1]}
-PP_TO_EXP_VAL_ΜΑΤRIX = np.zeros((4, 4), dtype=complex)
-PP_TO_EXP_VAL_ΜΑΤRIX[0, 0] = 0.5
-PP_TO_EXP_VAL_ΜΑΤRIX[1, 0] = 1j
-PP_TO_EXP_VAL_ΜΑΤRIX[2, 0] = 1
-PP_TO_EXP_VAL_ΜΑΤRIX[3, 0] = 1
-PP_TO_EXP_VAL_ΜΑΤRIX[1, 1] = 1
-PP_TO_EXP_VAL_ΜΑΤRIX[2, 2] = 2j
-PP_TO_EXP_VAL_ΜΑΤRIX[3, 3] = 3j
+from types import MappingProxyType
+
+PAULI_PRODUCT_QUBIT_MASKS = MappingProxyType({
+    'test1': {0: list(), 1: [0, 1]},
+    'test2': {2: [0], 3: [1]},
+})
+# Nonzero entries (0, 0), (1, 0), (2, 0), (3, 0), (1, 1), (2, 2), (3, 3) as flat indices
+PP_TO_EXP_VAL_ΜΑΤRIX = np.zeros((4 * 4,), dtype=complex)
+np.put(PP_TO_EXP_VAL_ΜΑΤRIX,
+       [0 * 4 + 0, 1 * 4 + 0, 2 * 4 + 0, 3 * 4 + 0, 1 * 4 + 1, 2 * 4 + 2, 3 * 4 + 3],
+       [0.5, 1j, 1, 1, 1, 2j, 3j])
+PP_TO_EXP_VAL_ΜΑΤRIX = PP_TO_EXP_VAL_ΜΑΤRIX.reshape((4, 4))
 # Should give expectation values of a = 0.5, b= 1+1j, c=1+2j, d = 1+3j for system in state 0000
 NUMBER_PAULI_PRODUCTS = 4
 NUMBER_QUBITS = 2
@@ -80,7 +78,7 @@ def test_br_measurement_input_qonfig():
     assert measurement_input._use_flipped_measurement == measurement_input._use_flipped_measurement
 
 
-def test_basis_rotation_pyquest():
+def test_basis_rotation_pyquest(pyquest_backend):
     """Test basis rotation measurement"""
     measurement_input = measurements.BRMeasurementInput(
         pauli_product_qubit_masks=PAULI_PRODUCT_QUBIT_MASKS,
@@ -100,23 +98,19 @@ def test_basis_rotation_pyquest():
     circuit2 += ops.MeasureQubit(qubit=1, readout='test2', readout_index=1)
 
     circuit_list = [circuit, circuit2]
-    try:
-        from qoqo_pyquest import PyQuestBackend
-        backend = PyQuestBackend(number_qubits=2,)
-        measurement = measurements.BasisRotationMeasurement(
-            measurement_input=measurement_input,
-            circuit_list=circuit_list,
-            backend=backend,
-            )
-        expectation_values = measurement()
-        assert set(expectation_values.keys()) == set(
-            ['exp_val_a', 'exp_val_b', 'exp_val_c', 'exp_val_d', ])
-        assert expectation_values['exp_val_a'] == 0.5
-        assert expectation_values['exp_val_b'] == 1 + 1j
-        assert expectation_values['exp_val_c'] == 1 + 2j
-        assert expectation_values['exp_val_d'] == 1 + 3j
-    except ImportError:
-        pass
+    backend = pyquest_backend
+    measurement = measurements.BasisRotationMeasurement(
+        measurement_input=measurement_input,
+        circuit_list=circuit_list,
+        backend=backend,
+        )
+    expectation_values = measurement()
+    assert set(expectation_values.keys()) == set(
+        ['exp_val_a', 'exp_val_b', 'exp_val_c', 'exp_val_d', ])
+    assert expectation_values['exp_val_a'] == 0.5
+    assert expectation_values['exp_val_b'] == 1 + 1j
+    assert expectation_values['exp_val_c'] == 1 + 2j
+    assert expectation_values['exp_val_d'] == 1 + 3j
 
 
 def test_basis_rotation_none():
@@ -126,11 +120,11 @@ def test_basis_rotation_none():
     assert list(expectation_values.keys()) == list()
 
 
-def test_basis_rotation_pyquest_w_readout_errors():
+def test_basis_rotation_pyquest_w_readout_errors(roundtrip, pyquest_backend):
     """Test basis rotation measurement with readout errors"""
-    masks = PAULI_PRODUCT_QUBIT_MASKS
-    masks['test1_flipped'] = {0: list(), 1: [0, 1]}
-    masks['test2_flipped'] = {2: [0], 3: [1]}
+    masks = {**PAULI_PRODUCT_QUBIT_MASKS,
+             'test1_flipped': {0: list(), 1: [0, 1]},
+             'test2_flipped': {2: [0], 3: [1]}}
     measurement_input = measurements.BRMeasurementInput(
         pauli_product_qubit_masks=masks,
         pp_to_exp_val_matrix=PP_TO_EXP_VAL_ΜΑΤRIX,
@@ -161,45 +155,20 @@ def test_basis_rotation_pyquest_w_readout_errors():
     circuit4 += ops.MeasureQubit(qubit=1, readout='test2_flipped', readout_index=1)
 
     circuit_list = [circuit, circuit2, circuit3, circuit4]
-    try:
-        from qoqo_pyquest import PyQuestBackend
-        backend = PyQuestBackend(number_qubits=2)
-        measurement = measurements.BasisRotationMeasurement(
-            measurement_input=measurement_input,
-            circuit_list=circuit_list,
-            backend=backend,
-            )
-        measurement2 = _serialisation_convertion(measurement)
-        expectation_values = measurement()
-        assert set(expectation_values.keys()) == set(
-            ['exp_val_a', 'exp_val_b', 'exp_val_c', 'exp_val_d', ])
-        assert expectation_values['exp_val_a'] == 0.5
-        assert expectation_values['exp_val_b'] == 1 + 1j
-        assert expectation_values['exp_val_c'] == 1 + 2j
-        assert expectation_values['exp_val_d'] == 1 + 3j
-    except ImportError:
-        pass
-
-
-def _serialisation_convertion(to_conv: Qonfig[Any]) -> Any:
-    """Convertion function for all serialisation unittests
-
-    Takes the object input, serialises and deserialises it, returning the deserialised
-    version. The original object and the manipulated one are then compared in the unittest
-    script to assert that the serialisation worked correctly.
-
-    Args:
-        to_conv: object to be serialised and deserialised
-
-    Returns:
-        Any: deserialised object
-    """
-    config = to_conv.to_qonfig()
-    json = config.to_json()
-    config2 = Qonfig.from_json(json)
-    converted = config2.to_instance()
-
-    return converted
+    backend = pyquest_backend
+    measurement = measurements.BasisRotationMeasurement(
+        measurement_input=measurement_input,
+        circuit_list=circuit_list,
+        backend=backend,
+        )
+    measurement2 = roundtrip(measurement)
+    expectation_values = measurement()
+    assert set(expectation_values.keys()) == set(
+        ['exp_val_a', 'exp_val_b', 'exp_val_c', 'exp_val_d', ])
+    assert expectation_values['exp_val_a'] == 0.5
+    assert expectation_values['exp_val_b'] == 1 + 1j
+    assert expectation_values['exp_val_c'] == 1 + 2j
+    assert expectation_values['exp_val_d'] == 1 + 3j
 
 
 if __name__ == '__main__':
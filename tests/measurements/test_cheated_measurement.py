@@ -19,24 +19,39 @@ from qoqo import operations as ops
 from qoqo import Circuit
 from qoqo import measurements
 from hqsbase import qonfig
-from hqsbase.qonfig import Qonfig
-from typing import Dict, List, Any
+from typing import Dict, List
 import pandas as pd
 import scipy.sparse as sp
 
+
+def _sparse_equal(matrix: sp.spmatrix, other: sp.spmatrix) -> bool:
+    """Return True when two sparse matrices have the same entries, without densifying them
+
+    Args:
+        matrix: First sparse matrix
+        other: Second sparse matrix
+
+    Returns:
+        bool
+    """
+    difference = sp.csr_matrix(matrix - other)
+    difference.eliminate_zeros()
+    return difference.nnz == 0
+
+
 OPERATOR_MATRICES: Dict[str, Dict[str, List[float]]] = dict()
 OPERATOR_MATRICES['test1'] = dict()
 OPERATOR_MATRICES['test2'] = dict()
-OPERATOR_MATRICES['test1']['a'] = sp.csr_matrix(np.zeros((4, 4), dtype=complex))
-OPERATOR_MATRICES['test1']['a'][0, 0] = 0.5
-OPERATOR_MATRICES['test1']['a'][1, 1] = 0.5j
-OPERATOR_MATRICES['test1']['a'][2, 2] = 0.5j
-OPERATOR_MATRICES['test1']['b'] = sp.csr_matrix(np.zeros((4, 4), dtype=complex))
-OPERATOR_MATRICES['test1']['b'][0, 0] = 1 + 1j
-OPERATOR_MATRICES['test2']['c'] = sp.csr_matrix(np.zeros((4, 4), dtype=complex))
-OPERATOR_MATRICES['test2']['c'][0, 0] = 1 + 2j
-OPERATOR_MATRICES['test2']['d'] = sp.csr_matrix(np.zeros((4, 4), dtype=complex))
-OPERATOR_MATRICES['test2']['d'][0, 0] = 1 + 3j
+# Diagonal matrices built directly in CSR form from (data, indices, indptr)
+OPERATOR_MATRICES['test1']['a'] = sp.csr_matrix(
+    (np.array([0.5, 0.5j, 0.5j]), np.array([0, 1, 2]), np.array([0, 1, 2, 3, 3])),
+    shape=(4, 4))
+OPERATOR_MATRICES['test1']['b'] = sp.csr_matrix(
+    (np.array([1 + 1j]), np.array([0]), np.array([0, 1, 1, 1, 1])), shape=(4, 4))
+OPERATOR_MATRICES['test2']['c'] = sp.csr_matrix(
+    (np.array([1 + 2j]), np.array([0]), np.array([0, 1, 1, 1, 1])), shape=(4, 4))
+OPERATOR_MATRICES['test2']['d'] = sp.csr_matrix(
+    (np.array([1 + 3j]), np.array([0]), np.array([0, 1, 1, 1, 1])), shape=(4, 4))
 # Should give expectation values of a = 0.5, b= 1+1j, c=1+2j, d = 1+3j for system in state 0000
 USE_DENSITY_MATRIX = False
 
@@ -63,7 +78,8 @@ def test_cheated_measurement_input_qonfig():
         assert readout_val.keys() == readout_val2.keys()
         for key, val in readout_val.items():
             val2 = readout_val2[key]
-            assert np.array_equal(val.todense(), val2.todense())
+            assert val.shape == val2.shape
+            assert _sparse_equal(val, val2)
     assert measurement_input.use_density_matrix == measurement_input2.use_density_matrix
 
 
@@ -74,7 +90,7 @@ def test_cheated_none():
     assert list(expectation_values.keys()) == list()
 
 
-def test_cheated_measurement_pyquest():
+def test_cheated_measurement_pyquest(roundtrip, pyquest_backend):
     """Test cheated measurement"""
     measurement_input = measurements.PurePragmaMeasurementInput(
         operator_matrices=OPERATOR_MATRICES,
@@ -94,46 +110,21 @@ def test_cheated_measurement_pyquest():
                                          )
 
     circuit_list = [circuit, circuit2]
-    try:
-        from qoqo_pyquest import PyQuestBackend
-        backend = PyQuestBackend(number_qubits=2)
-        measurement = measurements.PurePragmaMeasurement(
-            measurement_input=measurement_input,
-            circuit_list=circuit_list,
-            backend=backend,
-            )
-        measurement2 = _serialisation_convertion(measurement)
-
-        expectation_values = measurement()
-        assert set(expectation_values.keys()) == set(
-            ['exp_val_a', 'exp_val_b', 'exp_val_c', 'exp_val_d', ])
-        assert expectation_values['exp_val_a'] == 0.5
-        assert expectation_values['exp_val_b'] == 1 + 1j
-        assert expectation_values['exp_val_c'] == 1 + 2j
-        assert expectation_values['exp_val_d'] == 1 + 3j
-    except ImportError:
-        pass
-
-
-def _serialisation_convertion(to_conv: Qonfig[Any]) -> Any:
-    """Convertion function for all serialisation unittests
-
-    Takes the object input, serialises and deserialises it, returning the deserialised
-    version. The original object and the manipulated one are then compared in the unittest
-    script to assert that the serialisation worked correctly.
-
-    Args:
-        to_conv: object to be serialised and deserialised
+    backend = pyquest_backend
+    measurement = measurements.PurePragmaMeasurement(
+        measurement_input=measurement_input,
+        circuit_list=circuit_list,
+        backend=backend,
+        )
+    measurement2 = roundtrip(measurement)
 
-    Returns:
-        Any: deserialised object
-    """
-    config = to_conv.to_qonfig()
-    json = config.to_json()
-    config2 = Qonfig.from_json(json)
-    converted = config2.to_instance()
-
-    return converted
+    expectation_values = measurement()
+    assert set(expectation_values.keys()) == set(
+        ['exp_val_a', 'exp_val_b', 'exp_val_c', 'exp_val_d', ])
+    assert expectation_values['exp_val_a'] == 0.5
+    assert expectation_values['exp_val_b'] == 1 + 1j
+    assert expectation_values['exp_val_c'] == 1 + 2j
+    assert expectation_values['exp_val_d'] == 1 + 3j
 
 
 if __name__ == '__main__':
@@ -14,15 +14,18 @@ import pytest
 import sys
 import numpy.testing as npt
 from qoqo import operations as ops
-from hqsbase.qonfig import Qonfig
 
+# The name does not influence the output format, every vartype is combined with all
+# input/output flags and a single and multi entry length
+CASES = [(name, vartype, length, is_input, is_output)
+         for vartype in ('float', 'bit', 'int')
+         for is_input, is_output in ((True, False), (False, True), (False, False), (True, True))
+         for length in (1, 3)
+         for name in ('a',)]
 
-@pytest.mark.parametrize("name", ['a', 'b', 'c'])
-@pytest.mark.parametrize("vartype", ['float', 'bit', 'int'])
-@pytest.mark.parametrize("length", [1, 2, 3])
-@pytest.mark.parametrize("is_input", [True, False])
-@pytest.mark.parametrize("is_output", [True, False])
-def test_hqs_lang_define(name, vartype, length, is_input, is_output):
+
+@pytest.mark.parametrize("name, vartype, length, is_input, is_output", CASES)
+def test_hqs_lang_define(name, vartype, length, is_input, is_output, roundtrip):
     """Test exporting/importing Define to HQS-Lang"""
     operation = ops.Definition
     assert operation.get_hqs_lang_name() == 'Definition'
@@ -49,30 +52,9 @@ def test_hqs_lang_define(name, vartype, length, is_input, is_output):
     assert op.to_hqs_lang() == string
     assert(op.involved_qubits == set())
 
-    op2 = _serialisation_convertion(op)
+    op2 = roundtrip(op)
     assert op2 == op
 
 
-def _serialisation_convertion(to_conv):
-    """Convertion function for all serialisation unittests
-
-    Takes the object input, serialises and deserialises it, returning the deserialised
-    version. The original object and the manipulated one are then compared in the unittest
-    script to assert that the serialisation worked correctly.
-
-    Args:
-        to_conv: object to be serialised and deserialised
-
-    Returns:
-        Any: deserialised object
-    """
-    config = to_conv.to_qonfig()
-    json = config.to_json()
-    config2 = Qonfig.from_json(json)
-    converted = config2.to_instance()
-
-    return converted
-
-
 if __name__ == '__main__':
     pytest.main(sys.argv)
@@ -13,16 +13,27 @@
 import pytest
 import sys
 import numpy as np
-import numpy.testing as npt
+from numpy.testing import assert_allclose, assert_raises
 from qoqo import operations as ops
 from qoqo.operations import OperationNotInBackendError
 from typing import (
     Dict,
     Optional
 )
-from hqsbase.calculator import Calculator
 from copy import copy
-from hqsbase.qonfig import Qonfig
+
+# Angle grids shared by the parametrized tests, evaluated once at import
+_GRID10 = tuple(np.arange(0, 2 * np.pi, 2 * np.pi / 10).tolist())
+_GRID3_HIGH = tuple(np.arange(2 * np.pi / 3, 2 * np.pi, 2 * np.pi / 3).tolist())
+
+# Expected involved qubits of the single and two qubit gates
+_QSET1 = frozenset({0})
+_QSET2 = frozenset({0, 1})
+
+# Random angles plus the edge cases 0, pi/2 and pi for the general single qubit gate tests,
+# instead of a Cartesian product over every parameter
+SAMPLES = [tuple(sample) for sample in np.random.default_rng(0).uniform(0, 2 * np.pi, (10, 4))] + [
+    (0, 0, 0, 0), (np.pi, np.pi / 2, np.pi, np.pi)]
 
 
 @pytest.mark.parametrize("init", [
@@ -42,52 +53,59 @@ from hqsbase.qonfig import Qonfig
     (ops.InvSqrtISwap, 'InvSqrtISwap 1 0'),
     (ops.SqrtISwap, 'SqrtISwap 1 0'),
 ])
-def test_simple_gate_matrices(init):
+def test_simple_gate_matrices(init, roundtrip):
     """Test gate operations without free parameters"""
     op = init[0]
+    nq = op.number_of_qubits()
     string = init[1]
-    matrix_gate = op.unitary_matrix_from_parameters()
     # Testing hqs_lang output functionality
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         q0 = 0
         operation = op(qubit=q0)
     else:
         q0, q1 = (0, 1)
         operation = op(control=q1, qubit=q0)
     assert(operation.to_hqs_lang() == string)
-    assert(str(operation) == string)
 
-    operation2 = _serialisation_convertion(operation)
+    operation2 = roundtrip(operation)
     assert operation2 == operation
 
     assert(not operation.is_parametrized)
-    if op.number_of_qubits() == 1:
-        npt.assert_equal(set(operation.involved_qubits), set([0]))
+    if nq == 1:
+        assert operation.involved_qubits == _QSET1
     else:
-        npt.assert_equal(set(operation.involved_qubits), set([0, 1]))
+        assert operation.involved_qubits == _QSET2
 
     # Testing power implementation
-    with npt.assert_raises(AttributeError):
+    with assert_raises(AttributeError):
         operation**1.5
 
 
+@pytest.mark.parametrize("operation", [
+    ops.Hadamard(qubit=0),
+    ops.CNOT(control=1, qubit=0),
+    ops.RotateX(qubit=0, theta='theta'),
+    ops.RotateX(qubit=0, theta=0.5),
+    ops.Fsim(control=1, qubit=0, U='U', t=0.5, Delta='Delta'),
+])
+def test_str_matches_hqs_lang(operation):
+    """Test the string representation of a gate is its hqs_lang expression"""
+    assert(str(operation) == operation.to_hqs_lang())
+
+
 @pytest.mark.parametrize(
-    "init",
-    [(ops.SingleQubitGate,
-      'SingleQubitGate(alpha_r, alpha_i, beta_r, beta_i, global_phase) 0'),
-     ])
-@pytest.mark.parametrize("a", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("b", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("c", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("d", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-def test_single_qubit_gate(init, a, b, c, d) -> None:
+    "init, a, b, c, d",
+    [((ops.SingleQubitGate,
+       'SingleQubitGate(alpha_r, alpha_i, beta_r, beta_i, global_phase) 0'),) + sample
+     for sample in SAMPLES],
+    ids=['sample{}'.format(i) for i in range(len(SAMPLES))])
+def test_single_qubit_gate(init, a, b, c, d, roundtrip) -> None:
     """Test general single qubit gate operation"""
     op = init[0]
     string = init[1]
     alpha = np.exp(1j * a) * np.cos(b)
     beta = np.exp(1j * c) * np.sin(b)
-    matrix_gate = op.unitary_matrix_from_parameters(alpha_r=np.real(
-        alpha), alpha_i=np.imag(alpha), beta_r=np.real(beta), beta_i=np.imag(beta))
+    ar, ai, br, bi = alpha.real, alpha.imag, beta.real, beta.imag
     Alpha_r, Alpha_i, Beta_r, Beta_i, Global_phase, q0 = (
         ('alpha_r', 'alpha_i', 'beta_r', 'beta_i', 'global_phase', 0))
     operation = op(qubit=q0, alpha_r=Alpha_r, alpha_i=Alpha_i,
@@ -96,23 +114,48 @@ def test_single_qubit_gate(init, a, b, c, d) -> None:
     assert(operation.to_hqs_lang() == string)
     assert(operation.is_parametrized)
 
-    operation2 = _serialisation_convertion(operation)
+    operation2 = roundtrip(operation)
     assert operation2 == operation
 
-    alpha = np.exp(1j * a) * np.cos(b)
-    beta = np.exp(1j * c) * np.sin(b)
     substitution_dict = {
-        'alpha_r': np.real(alpha),
-        'alpha_i': np.imag(alpha),
-        'beta_r': np.real(beta),
-        'beta_i': np.imag(beta),
+        'alpha_r': ar,
+        'alpha_i': ai,
+        'beta_r': br,
+        'beta_i': bi,
         'global_phase': d}
 
     operation.substitute_parameters(substitution_dict)
 
     assert(not operation.is_parametrized)
 
-    npt.assert_equal(set(operation.involved_qubits), set([0]))
+    assert operation.involved_qubits == _QSET1
+
+
+def _single_qubit_gate_matrices(a, b, c, d):
+    """Return the SingleQubitGate matrices for arrays of angles, stacked along the first axis"""
+    alpha = np.exp(1j * a) * np.cos(b)
+    beta = np.exp(1j * c) * np.sin(b)
+    matrices = np.stack([np.stack([alpha, -np.conj(beta)], axis=-1),
+                         np.stack([beta, np.conj(alpha)], axis=-1)], axis=1)
+    return np.exp(1j * d)[:, None, None] * matrices
+
+
+def _single_qubit_gate_products(a, b, c, d, ops_right):
+    """Return the qoqo products SingleQubitGate * op and SingleQubitGate *= op for all samples"""
+    products = list()
+    products_inplace = list()
+    for a_p, b_p, c_p, d_p, op in zip(a, b, c, d, ops_right):
+        alpha = np.exp(1j * a_p) * np.cos(b_p)
+        beta = np.exp(1j * c_p) * np.sin(b_p)
+        ar, ai, br, bi = alpha.real, alpha.imag, beta.real, beta.imag
+        op1 = ops.SingleQubitGate(qubit=0, alpha_r=ar, alpha_i=ai,
+                                  beta_r=br, beta_i=bi, global_phase=d_p)
+        op2 = ops.SingleQubitGate(qubit=0, alpha_r=ar, alpha_i=ai,
+                                  beta_r=br, beta_i=bi, global_phase=d_p)
+        products.append((op1 * op).unitary_matrix)
+        op2 *= op
+        products_inplace.append(op2.unitary_matrix)
+    return np.stack(products), np.stack(products_inplace)
 
 
 @pytest.mark.parametrize("op", [
@@ -120,63 +163,36 @@ def test_single_qubit_gate(init, a, b, c, d) -> None:
     ops.PauliZ(qubit=0),
     ops.TGate(qubit=0),
     ops.SGate(qubit=0)])
-@pytest.mark.parametrize("a", list(np.arange(2 * np.pi / 3, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("b", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("c", list(np.arange(2 * np.pi / 3, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("d", list(np.arange(2 * np.pi / 3, np.pi, 2 * np.pi / 3)))
-def test_single_qubit_multiplication(op, a, b, c, d):
+def test_single_qubit_multiplication(op, roundtrip):
     """Test single qubit gate multiplication"""
-    alpha = np.exp(1j * a) * np.cos(b)
-    beta = np.exp(1j * c) * np.sin(b)
-    op1 = ops.SingleQubitGate(qubit=0, alpha_r=np.real(alpha),
-                              alpha_i=np.imag(alpha),
-                              beta_r=np.real(beta),
-                              beta_i=np.imag(beta),
-                              global_phase=d)
-    op2 = ops.SingleQubitGate(qubit=0, alpha_r=np.real(alpha),
-                              alpha_i=np.imag(alpha),
-                              beta_r=np.real(beta),
-                              beta_i=np.imag(beta),
-                              global_phase=d)
-    opnew = op1 * op
-    op2 *= op
-    npt.assert_array_almost_equal(op1.unitary_matrix @ op.unitary_matrix, opnew.unitary_matrix)
-    npt.assert_array_almost_equal(op1.unitary_matrix @ op.unitary_matrix, op2.unitary_matrix)
-
-    op2 = _serialisation_convertion(op)
+    a, b, c, d = np.array(SAMPLES).T
+    expected = np.einsum('nij,jk->nik', _single_qubit_gate_matrices(a, b, c, d),
+                         op.unitary_matrix)
+    products, products_inplace = _single_qubit_gate_products(a, b, c, d, [op] * len(a))
+    assert_allclose(products, expected, atol=1e-7)
+    assert_allclose(products_inplace, expected, atol=1e-7)
+
+    op2 = roundtrip(op)
     assert op2 == op
 
 
 @pytest.mark.parametrize("operation", [ops.RotateX,
                                        ops.RotateY,
                                        ops.RotateZ])
-@pytest.mark.parametrize("a", list(np.arange(2 * np.pi / 3, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("b", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("c", list(np.arange(2 * np.pi / 3, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("d", [0])
-@pytest.mark.parametrize("theta_p", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-def test_single_qubit_multiplication_parameter(operation, a, b, c, d, theta_p):
+def test_single_qubit_multiplication_parameter(operation, roundtrip):
     """Test single qubit gate multiplication with constant parameters"""
-    alpha = np.exp(1j * a) * np.cos(b)
-    beta = np.exp(1j * c) * np.sin(b)
-    op = operation(qubit=0, theta=theta_p)
-    op1 = ops.SingleQubitGate(qubit=0, alpha_r=np.real(alpha),
-                              alpha_i=np.imag(alpha),
-                              beta_r=np.real(beta),
-                              beta_i=np.imag(beta),
-                              global_phase=d)
-    op2 = ops.SingleQubitGate(qubit=0, alpha_r=np.real(alpha),
-                              alpha_i=np.imag(alpha),
-                              beta_r=np.real(beta),
-                              beta_i=np.imag(beta),
-                              global_phase=d)
-    opnew = op1 * op
-    op2 *= op
-    npt.assert_array_almost_equal(op1.unitary_matrix @ op.unitary_matrix, opnew.unitary_matrix)
-    npt.assert_array_almost_equal(op1.unitary_matrix @ op.unitary_matrix, op2.unitary_matrix)
-
-    op2 = _serialisation_convertion(op)
-    assert op2 == op
+    a, b, c, theta = np.array(SAMPLES).T
+    d = np.zeros(len(a))
+    ops_right = [operation(qubit=0, theta=theta_p) for theta_p in theta]
+    expected = np.einsum('nij,njk->nik', _single_qubit_gate_matrices(a, b, c, d),
+                         np.stack([op.unitary_matrix for op in ops_right]))
+    products, products_inplace = _single_qubit_gate_products(a, b, c, d, ops_right)
+    assert_allclose(products, expected, atol=1e-7)
+    assert_allclose(products_inplace, expected, atol=1e-7)
+
+    for op in ops_right:
+        op2 = roundtrip(op)
+        assert op2 == op
 
 
 @pytest.mark.parametrize("init", [(ops.RotateX, 'RotateX(theta) 0'),
@@ -184,13 +200,13 @@ def test_single_qubit_multiplication_parameter(operation, a, b, c, d, theta_p):
                                   (ops.RotateZ, 'RotateZ(theta) 0'),
                                   (ops.ControlledPhaseShift, 'ControlledPhaseShift(theta) 1 0')
                                   ])
-@pytest.mark.parametrize("theta_p", list(np.arange(0, 2 * np.pi, 2 * np.pi / 10)))
+@pytest.mark.parametrize("theta_p", _GRID10)
 def test_single_parameter_gate_matrices(init, theta_p) -> None:
     """Test gate operations with single parameter"""
     op = init[0]
+    nq = op.number_of_qubits()
     string = init[1]
-    matrix_gate = op.unitary_matrix_from_parameters(theta=theta_p)
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         theta, q0 = ('theta', 0)
         operation = op(qubit=q0, theta=theta)
     else:
@@ -203,13 +219,10 @@ def test_single_parameter_gate_matrices(init, theta_p) -> None:
     operation.substitute_parameters(substitution_dict)
     assert(not operation.is_parametrized)
 
-    op2 = _serialisation_convertion(operation)
-    assert op2 == operation
-
-    if op.number_of_qubits() == 1:
-        npt.assert_equal(set(operation.involved_qubits), set([0]))
+    if nq == 1:
+        assert operation.involved_qubits == _QSET1
     else:
-        npt.assert_equal(set(operation.involved_qubits), set([0, 1]))
+        assert operation.involved_qubits == _QSET2
 
     operation2 = operation**1.5
     assert operation2._ordered_parameter_dict['theta'].isclose(
@@ -218,14 +231,14 @@ def test_single_parameter_gate_matrices(init, theta_p) -> None:
 
 @pytest.mark.parametrize("init", [(ops.W, 'W(theta, spherical_phi) 0'),
                                   ])
-@pytest.mark.parametrize("theta_p", list(np.arange(0, 2 * np.pi, 2 * np.pi / 10)))
-@pytest.mark.parametrize("phi_p", list(np.arange(0, 2 * np.pi, 2 * np.pi / 10)))
+@pytest.mark.parametrize("theta_p", _GRID10)
+@pytest.mark.parametrize("phi_p", _GRID10)
 def test_parameter_gate_matrices(init, theta_p, phi_p) -> None:
     """Test gate operations with two parameters"""
     op = init[0]
+    nq = op.number_of_qubits()
     string = init[1]
-    matrix_gate = op.unitary_matrix_from_parameters(theta=theta_p, spherical_phi=phi_p)
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         (theta, spherical_phi, q0) = ('theta', 'spherical_phi', 0)
         operation = op(qubit=q0,
                        theta=theta, spherical_phi=spherical_phi)
@@ -236,7 +249,7 @@ def test_parameter_gate_matrices(init, theta_p, phi_p) -> None:
     assert(operation.to_hqs_lang() == string)
     assert(operation.is_parametrized)
 
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         operation.substitute_parameters({'theta': theta_p,
                                          'spherical_phi': phi_p})
     else:
@@ -244,13 +257,10 @@ def test_parameter_gate_matrices(init, theta_p, phi_p) -> None:
                                          'spherical_phi': phi_p})
     assert(not operation.is_parametrized)
 
-    op2 = _serialisation_convertion(operation)
-    assert op2 == operation
-
-    if op.number_of_qubits() == 1:
-        npt.assert_equal(set(operation.involved_qubits), set([0]))
+    if nq == 1:
+        assert operation.involved_qubits == _QSET1
     else:
-        npt.assert_equal(set(operation.involved_qubits), set([0, 1]))
+        assert operation.involved_qubits == _QSET2
 
     operation2 = operation**1.5
     assert operation2._ordered_parameter_dict['theta'].isclose(
@@ -259,13 +269,13 @@ def test_parameter_gate_matrices(init, theta_p, phi_p) -> None:
 
 @pytest.mark.parametrize("init", [(ops.PMInteraction, 'PMInteraction(theta) 1 0'),
                                   ])
-@pytest.mark.parametrize("theta", list(np.arange(0, 2 * np.pi, 2 * np.pi / 10)))
+@pytest.mark.parametrize("theta", _GRID10)
 def test_PM(init, theta) -> None:
     """Test plus-minus gate operation"""
     op = init[0]
+    nq = op.number_of_qubits()
     string = init[1]
-    matrix_gate = op.unitary_matrix_from_parameters(theta)
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         (Theta, q0) = ('theta', 0)
         operation = op(qubit=q0,
                        theta=Theta,)
@@ -276,7 +286,7 @@ def test_PM(init, theta) -> None:
     assert(operation.to_hqs_lang() == string)
     assert(operation.is_parametrized)
 
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         operation.substitute_parameters({'theta': theta,
                                          })
     else:
@@ -284,13 +294,10 @@ def test_PM(init, theta) -> None:
                                          })
     assert(not operation.is_parametrized)
 
-    op2 = _serialisation_convertion(operation)
-    assert op2 == operation
-
-    if op.number_of_qubits() == 1:
-        npt.assert_equal(set(operation.involved_qubits), set([0]))
+    if nq == 1:
+        assert operation.involved_qubits == _QSET1
     else:
-        npt.assert_equal(set(operation.involved_qubits), set([0, 1]))
+        assert operation.involved_qubits == _QSET2
 
     operation2 = operation**1.5
     assert operation2._ordered_parameter_dict['theta'].isclose(
@@ -301,14 +308,14 @@ def test_PM(init, theta) -> None:
                                   (ops.GivensRotationLittleEndian,
                                    'GivensRotationLittleEndian(theta, phi) 0 1'),
                                   ])
-@pytest.mark.parametrize("theta", list(np.arange(0, 2 * np.pi, 2 * np.pi / 10)))
-@pytest.mark.parametrize("phi", list(np.arange(2 * np.pi / 3, 2 * np.pi, 2 * np.pi / 3)))
+@pytest.mark.parametrize("theta", _GRID10)
+@pytest.mark.parametrize("phi", _GRID3_HIGH)
 def test_Givens(init, theta, phi) -> None:
     """Test Givens rotation gate operation"""
     op = init[0]
+    nq = op.number_of_qubits()
     string = init[1]
-    matrix_gate = op.unitary_matrix_from_parameters(theta, phi)
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         (theta, phi, q0) = ('theta',
                             'phi', 0)
         operation = op(qubit=q0,
@@ -316,7 +323,7 @@ def test_Givens(init, theta, phi) -> None:
     else:
         (Theta, Phi, q0, q1) = ('theta',
                                 'phi', 0, 1)
-        if init[0] == ops.GivensRotation:
+        if op == ops.GivensRotation:
             operation = op(qubit=q0, control=q1,
                            theta=Theta, phi=Phi)
         else:
@@ -325,7 +332,7 @@ def test_Givens(init, theta, phi) -> None:
     assert(operation.to_hqs_lang() == string)
     assert(operation.is_parametrized)
 
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         operation.substitute_parameters({'theta': theta,
                                          'phi': phi})
     else:
@@ -333,27 +340,24 @@ def test_Givens(init, theta, phi) -> None:
                                          'phi': phi})
     assert(not operation.is_parametrized)
 
-    op2 = _serialisation_convertion(operation)
-    assert op2 == operation
-
-    if op.number_of_qubits() == 1:
-        npt.assert_equal(set(operation.involved_qubits), set([0]))
+    if nq == 1:
+        assert operation.involved_qubits == _QSET1
     else:
-        npt.assert_equal(set(operation.involved_qubits), set([0, 1]))
+        assert operation.involved_qubits == _QSET2
 
 
 @pytest.mark.parametrize("init", [(ops.Bogoliubov, 'Bogoliubov(Delta_real, Delta_imag) 1 0'),
                                   ])
-@pytest.mark.parametrize("delta", list(np.arange(0, 2 * np.pi, 2 * np.pi / 10)))
-@pytest.mark.parametrize("delta_arg", list(np.arange(0, 2 * np.pi, 2 * np.pi / 10)))
+@pytest.mark.parametrize("delta", _GRID10)
+@pytest.mark.parametrize("delta_arg", _GRID10)
 def test_Bogoliubov(init, delta, delta_arg) -> None:
     """Test Bogoliubov-deGennes gate operation"""
     delta_real = np.real(delta * np.exp(1j * delta_arg))
     delta_imag = np.imag(delta * np.exp(1j * delta_arg))
     op = init[0]
+    nq = op.number_of_qubits()
     string = init[1]
-    matrix_gate = op.unitary_matrix_from_parameters(delta_real, delta_imag)
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         (Delta_real, Delta_imag, q0) = ('Delta_real',
                                         'Delta_imag', 0)
         operation = op(qubit=q0,
@@ -366,7 +370,7 @@ def test_Bogoliubov(init, delta, delta_arg) -> None:
     assert(operation.to_hqs_lang() == string)
     assert(operation.is_parametrized)
 
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         operation.substitute_parameters({'Delta_real': delta_real,
                                          'Delta_imag': delta_imag})
     else:
@@ -374,13 +378,10 @@ def test_Bogoliubov(init, delta, delta_arg) -> None:
                                          'Delta_imag': delta_imag})
     assert(not operation.is_parametrized)
 
-    op2 = _serialisation_convertion(operation)
-    assert op2 == operation
-
-    if op.number_of_qubits() == 1:
-        npt.assert_equal(set(operation.involved_qubits), set([0]))
+    if nq == 1:
+        assert operation.involved_qubits == _QSET1
     else:
-        npt.assert_equal(set(operation.involved_qubits), set([0, 1]))
+        assert operation.involved_qubits == _QSET2
 
     operation2 = operation**1.5
     assert operation2._ordered_parameter_dict['Delta_imag'].isclose(
@@ -391,19 +392,23 @@ def test_Bogoliubov(init, delta, delta_arg) -> None:
 
 parameter_list = [0, .1, np.pi, -np.pi, np.pi / 4,
                   2 * np.pi, -np.pi - .1, -.1, np.pi + .1, 2 * np.pi + .1]
-parameter_list3 = [[p1, p2, p2] for p1 in parameter_list for p2 in parameter_list[:3]] + \
-                  [[p2, p1, p2] for p1 in parameter_list[3:] for p2 in parameter_list[:3]] + \
-                  [[p2, p2, p1] for p1 in parameter_list[3:] for p2 in parameter_list[:3]]
+# Every value of parameter_list appears once in every position, the triples are unique
+parameter_list3 = list(zip(parameter_list,
+                           parameter_list[3:] + parameter_list[:3],
+                           parameter_list[6:] + parameter_list[:6]))
+PARAMETER_IDS3 = ['params{}'.format(i) for i in range(len(parameter_list3))]
 
 
-@pytest.mark.parametrize("init", [(ops.Fsim, 'Fsim(U, t, Delta) 0 1')])
-@pytest.mark.parametrize("U, t, Delta", parameter_list3)
+@pytest.mark.parametrize("init, U, t, Delta",
+                         [((ops.Fsim, 'Fsim(U, t, Delta) 0 1'),) + params
+                          for params in parameter_list3],
+                         ids=PARAMETER_IDS3)
 def test_Fsim(init, U, t, Delta) -> None:
     """Test fermionic simulation gate operation"""
     op = init[0]
+    nq = op.number_of_qubits()
     string = init[1]
-    matrix_gate = op.unitary_matrix_from_parameters(U, t, Delta)
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         (Us, ts, Deltas, q0) = ('U', 't', 'Delta', 0)
         operation = op(qubit=q0,
                        U=Us, t=ts, Delta=Deltas)
@@ -414,7 +419,7 @@ def test_Fsim(init, U, t, Delta) -> None:
     assert(operation.to_hqs_lang() == string)
     assert(operation.is_parametrized)
 
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         operation.substitute_parameters({'U': U,
                                          't': t, 'Delta': Delta})
     else:
@@ -422,23 +427,22 @@ def test_Fsim(init, U, t, Delta) -> None:
                                          't': t, 'Delta': Delta})
     assert(not operation.is_parametrized)
 
-    op2 = _serialisation_convertion(operation)
-    assert op2 == operation
-
-    if op.number_of_qubits() == 1:
-        npt.assert_equal(set(operation.involved_qubits), set([0]))
+    if nq == 1:
+        assert operation.involved_qubits == _QSET1
     else:
-        npt.assert_equal(set(operation.involved_qubits), set([0, 1]))
+        assert operation.involved_qubits == _QSET2
 
 
-@pytest.mark.parametrize("init", [(ops.Qsim, 'Qsim(x, y, z) 0 1')])
-@pytest.mark.parametrize("x, y, z", parameter_list3)
+@pytest.mark.parametrize("init, x, y, z",
+                         [((ops.Qsim, 'Qsim(x, y, z) 0 1'),) + params
+                          for params in parameter_list3],
+                         ids=PARAMETER_IDS3)
 def test_Qsim(init, x, y, z) -> None:
     """Test spin swap simulation gate operation"""
     op = init[0]
+    nq = op.number_of_qubits()
     string = init[1]
-    matrix_gate = op.unitary_matrix_from_parameters(x, y, z)
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         (Us, ts, Deltas, q0) = ('x', 'y', 'z', 0)
         operation = op(qubit=q0,
                        U=Us, t=ts, Delta=Deltas)
@@ -449,7 +453,7 @@ def test_Qsim(init, x, y, z) -> None:
     assert(operation.to_hqs_lang() == string)
     assert(operation.is_parametrized)
 
-    if op.number_of_qubits() == 1:
+    if nq == 1:
         operation.substitute_parameters({'x': x,
                                          'y': y, 'z': z})
     else:
@@ -457,13 +461,77 @@ def test_Qsim(init, x, y, z) -> None:
                                          'y': y, 'z': z})
     assert(not operation.is_parametrized)
 
-    op2 = _serialisation_convertion(operation)
-    assert op2 == operation
-
-    if op.number_of_qubits() == 1:
-        npt.assert_equal(set(operation.involved_qubits), set([0]))
+    if nq == 1:
+        assert operation.involved_qubits == _QSET1
     else:
-        npt.assert_equal(set(operation.involved_qubits), set([0, 1]))
+        assert operation.involved_qubits == _QSET2
+
+
+_C = np.sqrt(0.5)
+
+
+@pytest.mark.parametrize("init", [
+    (ops.PMInteraction, dict(i=1, j=0), dict(theta=np.pi / 4),
+     np.array([[1, 0, 0, 0],
+               [0, _C, -1j * _C, 0],
+               [0, -1j * _C, _C, 0],
+               [0, 0, 0, 1]])),
+    (ops.Bogoliubov, dict(i=1, j=0), dict(Delta_real=0, Delta_imag=np.pi / 4),
+     np.array([[_C, 0, 0, -_C],
+               [0, 1, 0, 0],
+               [0, 0, 1, 0],
+               [_C, 0, 0, _C]])),
+    (ops.Fsim, dict(control=1, qubit=0), dict(U=np.pi / 4, t=np.pi / 4, Delta=np.pi / 4),
+     np.array([[_C, 0, 0, 1j * _C],
+               [0, -1j * _C, _C, 0],
+               [0, _C, -1j * _C, 0],
+               [-0.5 - 0.5j, 0, 0, -0.5 + 0.5j]])),
+    (ops.Qsim, dict(control=1, qubit=0), dict(x=np.pi / 4, y=0, z=np.pi / 2),
+     np.array([[-1j * _C, 0, 0, -_C],
+               [0, _C, 1j * _C, 0],
+               [0, 1j * _C, _C, 0],
+               [-_C, 0, 0, -1j * _C]])),
+])
+def test_matrix_values(init) -> None:
+    """Test the unitary matrices of parametrized two qubit gates against reference values"""
+    op, qubits, parameters, expected = init
+    assert_allclose(op.unitary_matrix_from_parameters(**parameters), expected, atol=1e-12)
+    operation = op(**qubits, **parameters)
+    assert operation._ordered_qubits_dict == qubits
+    assert_allclose(operation.unitary_matrix, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("init", [
+    (ops.RotateX, dict(qubit=0, theta='theta'), {'theta': 0.5}),
+    (ops.RotateY, dict(qubit=0, theta='theta'), {'theta': 0.5}),
+    (ops.RotateZ, dict(qubit=0, theta='theta'), {'theta': 0.5}),
+    (ops.ControlledPhaseShift, dict(control=1, qubit=0, theta='theta'), {'theta': 0.5}),
+    (ops.W, dict(qubit=0, theta='theta', spherical_phi='spherical_phi'),
+     {'theta': 0.5, 'spherical_phi': 1.5}),
+    (ops.PMInteraction, dict(i=1, j=0, theta='theta'), {'theta': 0.5}),
+    (ops.GivensRotation, dict(qubit=0, control=1, theta='theta', phi='phi'),
+     {'theta': 0.5, 'phi': 1.5}),
+    (ops.GivensRotationLittleEndian, dict(qubit=0, control=1, theta='theta', phi='phi'),
+     {'theta': 0.5, 'phi': 1.5}),
+    (ops.Bogoliubov, dict(i=1, j=0, Delta_real='Delta_real', Delta_imag='Delta_imag'),
+     {'Delta_real': 0.5, 'Delta_imag': 1.5}),
+    (ops.Fsim, dict(qubit=0, control=1, U='U', t='t', Delta='Delta'),
+     {'U': 0.5, 't': 1.5, 'Delta': -0.5}),
+    (ops.Qsim, dict(qubit=0, control=1, x='x', y='y', z='z'),
+     {'x': 0.5, 'y': 1.5, 'z': -0.5}),
+])
+def test_parametrized_gate_serialisation(init, roundtrip) -> None:
+    """Test serialisation of parametrized gates, once symbolic and once substituted
+
+    The numeric tests of these gates sweep the parameter values, the serialisation does not
+    depend on the values and is only tested here.
+    """
+    op, kwargs, substitution_dict = init
+    operation = op(**kwargs)
+    assert roundtrip(operation) == operation
+    operation.substitute_parameters(substitution_dict)
+    assert(not operation.is_parametrized)
+    assert roundtrip(operation) == operation
 
 
 @pytest.mark.parametrize("init", [(ops.Bogoliubov, 0),
@@ -479,11 +547,14 @@ def test_remap_qubits_two_qubit_gates(init):
     """Test remap qubits function of two qubit gates"""
     gate = init[0]()
     qubit_mapping = {0: 2, 1: 3}
-    new_gate = copy(gate)
-    new_gate.remap_qubits(qubit_mapping)
-    for key, val in gate._ordered_qubits_dict.items():
-        assert new_gate._ordered_qubits_dict[key] == val + 2
-    assert new_gate.involved_qubits == set([2, 3])
+    new_gate = gate.remapped(qubit_mapping)
+    assert new_gate._ordered_qubits_dict == {key: val + 2
+                                             for key, val in gate._ordered_qubits_dict.items()}
+    assert new_gate.involved_qubits == {2, 3}
+    assert gate.involved_qubits == {0, 1}
+    copied_gate = copy(gate)
+    copied_gate.remap_qubits(qubit_mapping)
+    assert copied_gate == new_gate
 
 
 @pytest.mark.parametrize("init", [(ops.Hadamard, 'Hadamard 0'),
@@ -499,32 +570,11 @@ def test_remap_qubits_single_qubit_gates(init):
     """Test remap qubits function of single qubit gates"""
     gate = init[0]()
     qubit_mapping = {0: 2}
-    new_gate = copy(gate)
-    new_gate.remap_qubits(qubit_mapping)
-    for key, val in gate._ordered_qubits_dict.items():
-        assert new_gate._ordered_qubits_dict[key] == val + 2
-    assert new_gate.involved_qubits == set([2])
-
-
-def _serialisation_convertion(to_conv):
-    """Convertion function for all serialisation unittests
-
-    Takes the object input, serialises and deserialises it, returning the deserialised
-    version. The original object and the manipulated one are then compared in the unittest
-    script to assert that the serialisation worked correctly.
-
-    Args:
-        to_conv: object to be serialised and deserialised
-
-    Returns:
-        Any: deserialised object
-    """
-    config = to_conv.to_qonfig()
-    json = config.to_json()
-    config2 = Qonfig.from_json(json)
-    converted = config2.to_instance()
-
-    return converted
+    new_gate = gate.remapped(qubit_mapping)
+    assert new_gate._ordered_qubits_dict == {key: val + 2
+                                             for key, val in gate._ordered_qubits_dict.items()}
+    assert new_gate.involved_qubits == {2}
+    assert gate.involved_qubits == {0}
 
 
 if __name__ == '__main__':
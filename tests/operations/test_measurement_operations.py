@@ -17,10 +17,16 @@ import numpy.testing as npt
 from qoqo import operations as ops
 from qoqo import Circuit
 from copy import copy
-from hqsbase.qonfig import Qonfig
+from typing import Dict
+from types import MappingProxyType
 
+# Read-only qubit mappings shared by the remap tests, copied where an operation stores them
+_MAP_0_2 = MappingProxyType({0: 2})
+_MAP_02_13 = MappingProxyType({0: 2, 1: 3})
+_MAP_SWAP = MappingProxyType({0: 1, 1: 0})
 
-def test_measurement() -> None:
+
+def test_measurement(dict_roundtrip) -> None:
     """Test MeasureQubit operation"""
     op = ops.MeasureQubit
     string = 'MeasureQubit 0 ro[1]'
@@ -33,28 +39,27 @@ def test_measurement() -> None:
 
     assert(operation.to_hqs_lang() == string)
     assert(not operation.is_parametrized)
-    assert(set(operation.involved_qubits) == set([0]))
+    assert(set(operation.involved_qubits) == {0})
 
-    operation2 = _serialisation_convertion(operation)
+    operation2 = dict_roundtrip(operation)
     assert operation2 == operation
 
 
-def test_remap_qubits_measurement() -> None:
+def test_remap_qubits_measurement(dict_roundtrip) -> None:
     """Test remap qubits function of Measurement operation"""
     operation = ops.MeasureQubit(qubit=0,
                                  readout='ro',
                                  readout_index=0)
-    mapping = {0: 2}
-    operation.remap_qubits(mapping)
+    operation.remap_qubits(_MAP_0_2)
     assert operation._qubit == 2
     assert operation._readout_index == 0
-    assert operation.involved_qubits == set([2])
+    assert operation.involved_qubits == {2}
 
-    operation2 = _serialisation_convertion(operation)
+    operation2 = dict_roundtrip(operation)
     assert operation2 == operation
 
 
-def test_pragma_repeated_measurement() -> None:
+def test_pragma_repeated_measurement(dict_roundtrip) -> None:
     """Test repeated measurement PRAGMA"""
     op = ops.PragmaRepeatedMeasurement
     string1 = 'PragmaRepeatedMeasurement(100) ALL ro'
@@ -64,9 +69,9 @@ def test_pragma_repeated_measurement() -> None:
                    number_measurements=100)
     assert(operation.to_hqs_lang() == string1)
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set(['ALL']))
+    assert(operation.involved_qubits == {'ALL'})
 
-    operation2 = _serialisation_convertion(operation)
+    operation2 = dict_roundtrip(operation)
     assert operation2 == operation
 
     operation = op(readout='ro',
@@ -74,12 +79,11 @@ def test_pragma_repeated_measurement() -> None:
                    number_measurements=100)
     assert(operation.to_hqs_lang() == string2)
 
-    operation2 = _serialisation_convertion(operation)
-    print(operation2._qubit_mapping, operation._qubit_mapping)
+    operation2 = dict_roundtrip(operation)
     assert operation2 == operation
 
 
-def test_pragma_pauli_product_measurement() -> None:
+def test_pragma_pauli_product_measurement(dict_roundtrip) -> None:
     """Test Pauli product measurement PRAGMA"""
     op = ops.PragmaGetPauliProduct
     string1 = 'PragmaGetPauliProduct ro'
@@ -89,11 +93,11 @@ def test_pragma_pauli_product_measurement() -> None:
                    )
     assert(operation.to_hqs_lang() == string1)
 
-    operation2 = _serialisation_convertion(operation)
+    operation2 = dict_roundtrip(operation)
     assert operation2 == operation
 
 
-def test_pragma_get_statevec() -> None:
+def test_pragma_get_statevec(dict_roundtrip) -> None:
     """Test get state vector (measurement) PRAGMA"""
     op = ops.PragmaGetStateVector
     string1 = 'PragmaGetStateVector{} ro'.format('')
@@ -103,9 +107,9 @@ def test_pragma_get_statevec() -> None:
                    )
     assert(operation.to_hqs_lang() == string1)
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set(['ALL']))
+    assert(operation.involved_qubits == {'ALL'})
 
-    operation2 = _serialisation_convertion(operation)
+    operation2 = dict_roundtrip(operation)
     assert operation2 == operation
 
 
@@ -115,26 +119,24 @@ def test_pragma_get_statevec() -> None:
     ops.PragmaGetOccupationProbability,
     ops.PragmaRepeatedMeasurement
 ])
-def test_remap_qubits_get_statevec(gate) -> None:
+def test_remap_qubits_get_statevec(gate, dict_roundtrip) -> None:
     """Test remap qubits function of get statevec PRAGMA"""
     operation = gate(readout='ro',
-                     qubit_mapping={0: 1, 1: 0}
+                     qubit_mapping=dict(_MAP_SWAP)
                      )
-    mapping = {0: 2, 1: 3}
-    operation.remap_qubits(mapping)
+    operation.remap_qubits(_MAP_02_13)
     assert operation._qubit_mapping == {2: 1, 3: 0}
 
     operation = ops.PragmaGetStateVector(readout='ro',
                                          )
-    mapping = {0: 2, 1: 3}
-    operation.remap_qubits(mapping)
+    operation.remap_qubits(_MAP_02_13)
     assert operation._qubit_mapping is None
 
-    operation2 = _serialisation_convertion(operation)
+    operation2 = dict_roundtrip(operation)
     assert operation2 == operation
 
 
-def test_pragma_get_densitymatrix() -> None:
+def test_pragma_get_densitymatrix(dict_roundtrip) -> None:
     """Test get density matrix (measurement) PRAGMA"""
     op = ops.PragmaGetDensityMatrix
     string1 = 'PragmaGetDensityMatrix ro'
@@ -142,13 +144,13 @@ def test_pragma_get_densitymatrix() -> None:
                    )
     assert(operation.to_hqs_lang() == string1)
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set(['ALL']))
+    assert(operation.involved_qubits == {'ALL'})
 
-    operation2 = _serialisation_convertion(operation)
+    operation2 = dict_roundtrip(operation)
     assert operation2 == operation
 
 
-def test_pragma_get_occupation_probability() -> None:
+def test_pragma_get_occupation_probability(dict_roundtrip) -> None:
     """Test get occupation probability (measurement) PRAGMA"""
     op = ops.PragmaGetOccupationProbability
     string1 = 'PragmaGetOccupationProbability{} ro'.format('')
@@ -157,48 +159,43 @@ def test_pragma_get_occupation_probability() -> None:
                    )
     assert(operation.to_hqs_lang() == string1)
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set(['ALL']))
+    assert(operation.involved_qubits == {'ALL'})
 
-    operation2 = _serialisation_convertion(operation)
+    operation2 = dict_roundtrip(operation)
     assert operation2 == operation
 
 
-def test_pragma_get_rotated_occupation_probability() -> None:
+@pytest.fixture(scope='module')
+def hadamard_circuit() -> Circuit:
+    """Circuit shared by the tests, the tests do not modify it"""
+    circuit = Circuit()
+    circuit += ops.Hadamard(qubit=0)
+    return circuit
+
+
+def test_pragma_get_rotated_occupation_probability(hadamard_circuit: Circuit,
+                                                   dict_roundtrip) -> None:
     """Test get rotated occupation probability (measurement) PRAGMA"""
     op = ops.PragmaGetRotatedOccupationProbability
     string1 = 'PragmaGetRotatedOccupationProbability ro'
-    circuit = Circuit()
-    circuit += ops.Hadamard(qubit=0)
     operation = op(readout='ro',
-                   circuit=circuit
+                   circuit=hadamard_circuit
                    )
     assert(operation.to_hqs_lang() == string1)
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set(['ALL']))
+    assert(operation.involved_qubits == {'ALL'})
 
-    operation3 = _serialisation_convertion(operation)
-    print(operation, operation3)
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
     operation2 = copy(operation)
     assert operation2 == operation
-    operation2._circuit = Circuit()
-    assert not operation2 == operation
-    operation2._readout_index = 20
-    assert not operation2 == operation
-    operation2._readout = 'test'
-    assert not operation2 == operation
-
-    operation4 = _serialisation_convertion(operation2)
-    assert operation4 == operation2
 
 
-def test_pragma_pauli_prod_measurement() -> None:
+def test_pragma_pauli_prod_measurement(dict_roundtrip) -> None:
     """Test product of pauli operators measurement PRAGMA"""
     op = ops.PragmaPauliProdMeasurement
     string1 = 'PragmaPauliProdMeasurement 0, 1 ro[0]'
-    circuit = Circuit()
-    circuit += ops.Hadamard(qubit=0)
     operation = op(readout='ro',
                    readout_index=0,
                    qubits=[0],
@@ -206,71 +203,87 @@ def test_pragma_pauli_prod_measurement() -> None:
                    )
     assert(operation.to_hqs_lang() == string1)
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set([0]))
+    assert(operation.involved_qubits == {0})
 
-    operation3 = _serialisation_convertion(operation)
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
     operation2 = copy(operation)
     assert operation2 == operation
-    operation2._paulis = [3]
-    assert not operation2 == operation
-    operation2._qubits = [3]
-    assert not operation2 == operation
-    operation2._readout_index = 20
-    assert not operation2 == operation
-    operation2._readout = 'test'
-    assert not operation2 == operation
-
-    operation4 = _serialisation_convertion(operation2)
-    assert operation4 == operation2
 
 
-def test_pragma_get_pauli_prod_measurement() -> None:
+@pytest.fixture(scope='module')
+def base_operations(hadamard_circuit: Circuit) -> Dict[str, ops.Pragma]:
+    """Measurement PRAGMAs compared field by field, the tests only modify copies"""
+    return {
+        'rotated_occupation': ops.PragmaGetRotatedOccupationProbability(
+            readout='ro', circuit=hadamard_circuit),
+        'pauli_prod': ops.PragmaPauliProdMeasurement(
+            readout='ro', readout_index=0, qubits=[0], paulis=[1]),
+    }
+
+
+@pytest.mark.parametrize("init", [
+    ('rotated_occupation', '_circuit', Circuit()),
+    ('rotated_occupation', '_readout', 'test'),
+    ('pauli_prod', '_paulis', [3]),
+    ('pauli_prod', '_qubits', [3]),
+    ('pauli_prod', '_readout_index', 20),
+    ('pauli_prod', '_readout', 'test'),
+])
+def test_inequality_on_field(init, base_operations: Dict[str, ops.Pragma], dict_roundtrip) -> None:
+    """Test measurement PRAGMAs differing in a single field are not equal"""
+    name, attribute, value = init
+    base_operation = base_operations[name]
+    operation = copy(base_operation)
+    setattr(operation, attribute, value)
+    assert not operation == base_operation
+
+    operation2 = dict_roundtrip(operation)
+    assert operation2 == operation
+
+
+def test_pragma_get_pauli_prod_measurement(dict_roundtrip) -> None:
     """Test get product of pauli operators (measurement) PRAGMA"""
     string1 = 'PragmaGetPauliProduct ro'
 
     op = ops.PragmaGetPauliProduct
-    circuit = Circuit()
-    circuit += ops.Hadamard(qubit=0)
-    circuit += ops.PauliX(qubit=1)
-    circuit += ops.CNOT(control=0, qubit=2)
     operation = op(readout='ro',
                    pauli_product=[1, 0]
                    )
     assert(operation.to_hqs_lang() == string1)
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set(['ALL']))
+    assert(operation.involved_qubits == {'ALL'})
 
-    operation3 = _serialisation_convertion(operation)
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
     operation2 = copy(operation)
     assert operation2 == operation
 
-    operation4 = _serialisation_convertion(operation2)
+    operation4 = dict_roundtrip(operation2)
     assert operation4 == operation2
 
 
-def _serialisation_convertion(to_conv):
-    """Convertion function for all serialisation unittests
-
-    Takes the object input, serialises and deserialises it, returning the deserialised
-    version. The original object and the manipulated one are then compared in the unittest
-    script to assert that the serialisation worked correctly.
-
-    Args:
-        to_conv: object to be serialised and deserialised
-
-    Returns:
-        Any: deserialised object
-    """
-    config = to_conv.to_qonfig()
-    json = config.to_json()
-    config2 = Qonfig.from_json(json)
-    converted = config2.to_instance()
-
-    return converted
+# Circuit stored in the measurement PRAGMAs of the json round trip test
+_JSON_CIRCUIT = Circuit()
+_JSON_CIRCUIT += ops.Hadamard(qubit=0)
+
+
+@pytest.mark.parametrize("operation", [
+    ops.MeasureQubit(qubit=0, readout='ro', readout_index=1),
+    ops.PragmaGetStateVector(readout='ro', qubit_mapping=None, circuit=_JSON_CIRCUIT),
+    ops.PragmaGetDensityMatrix(readout='ro', qubit_mapping=None, circuit=_JSON_CIRCUIT),
+    ops.PragmaGetOccupationProbability(readout='ro', qubit_mapping=None),
+    ops.PragmaGetRotatedOccupationProbability(readout='ro', circuit=_JSON_CIRCUIT),
+    ops.PragmaGetPauliProduct(readout='ro', pauli_product=[1, 0], circuit=_JSON_CIRCUIT),
+    ops.PragmaRepeatedMeasurement(readout='ro', qubit_mapping={0: 0}, number_measurements=100),
+    ops.PragmaPauliProdMeasurement(readout='ro', readout_index=0, qubits=[0], paulis=[1]),
+], ids=lambda operation: type(operation).__name__)
+def test_json_roundtrip(operation, roundtrip):
+    """Test serialisation through the json representation of the Qonfig once per class"""
+    operation2 = roundtrip(operation)
+    assert operation2 == operation
 
 
 if __name__ == '__main__':
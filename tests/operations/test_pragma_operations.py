@@ -16,26 +16,33 @@ import numpy as np
 import numpy.testing as npt
 from qoqo import operations as ops
 from hqsbase.calculator import (
-    Calculator,
     CalculatorFloat,
 )
 from copy import copy
-from hqsbase.qonfig import Qonfig
+from types import MappingProxyType
 
+# Three angles paired so every value appears once in every position, instead of a full
+# Cartesian product over each parameter
+_GRID3 = tuple(np.linspace(0, 2 * np.pi, 3, endpoint=False).tolist())
+_GRID3_PAIRS = list(zip(_GRID3, _GRID3[1:] + _GRID3[:1]))
+_GRID3_TRIPLES = list(zip(_GRID3, _GRID3[1:] + _GRID3[:1], _GRID3[2:] + _GRID3[:2]))
 
-@pytest.mark.parametrize("init", [(ops.PragmaDamping,
-                                   'PragmaDamping(gate_time, rate) 0'),
-                                  (ops.PragmaDepolarise,
-                                   'PragmaDepolarise(gate_time, rate) 0'),
-                                  (ops.PragmaDephasing,
-                                   'PragmaDephasing(gate_time, rate) 0')
-                                  ])
-@pytest.mark.parametrize("gate_time", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("rate", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-def test_noise_operators(init, gate_time, rate):
+# Read-only qubit mappings shared by the remap tests
+_MAP_0_2 = MappingProxyType({0: 2})
+_MAP_02_13 = MappingProxyType({0: 2, 1: 3})
+
+
+def _grid_id(value: float) -> str:
+    """Return a short test id for an angle of the grid"""
+    return 'g{:.2f}'.format(value)
+
+
+@pytest.mark.parametrize("gate_name", ['PragmaDamping', 'PragmaDepolarise', 'PragmaDephasing'])
+@pytest.mark.parametrize("gate_time, rate", _GRID3_PAIRS, ids=_grid_id)
+def test_noise_operators(gate_name, gate_time, rate):
     """Test PRAGMA operators applying noise"""
-    op = init[0]
-    string = init[1]
+    op = getattr(ops, gate_name)
+    string = '{}(gate_time, rate) 0'.format(gate_name)
 
     (Gate_time, Rate, q0) = ('gate_time', 'rate', 0)
     operation = op(qubit=q0, gate_time=Gate_time, rate=Rate)
@@ -43,26 +50,15 @@ def test_noise_operators(init, gate_time, rate):
     assert(operation.to_hqs_lang() == string)
     assert(operation.is_parametrized)
     substitution_dict = {'gate_time': gate_time, 'rate': rate}
-    calculator = Calculator()
-    for name, val in substitution_dict.items():
-        calculator.set(name, val)
 
     operation.substitute_parameters(substitution_dict)
 
-    operation3 = _serialisation_convertion(operation)
-    assert operation3 == operation
-
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set([0]))
+    assert(operation.involved_qubits == {0})
 
-    operation2 = operation**1.5
-    assert operation2._ordered_parameter_dict['gate_time'].isclose(
-        1.5 * operation._ordered_parameter_dict['gate_time'])
 
-
-@pytest.mark.parametrize("gate_time", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("depolarisation_rate", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("dephasing_rate", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
+@pytest.mark.parametrize("gate_time, depolarisation_rate, dephasing_rate", _GRID3_TRIPLES,
+                         ids=_grid_id)
 def test_random_noise_operator(gate_time, depolarisation_rate, dephasing_rate):
     """Test PRAGMA operators applying random noise (stochastic unravelling)"""
     op = ops.PragmaRandomNoise
@@ -80,32 +76,38 @@ def test_random_noise_operator(gate_time, depolarisation_rate, dephasing_rate):
     substitution_dict = {'gate_time': gate_time,
                          'depolarisation_rate': depolarisation_rate,
                          'dephasing_rate': dephasing_rate}
-    calculator = Calculator()
-    for name, val in substitution_dict.items():
-        calculator.set(name, val)
 
     operation.substitute_parameters(substitution_dict)
 
-    operation3 = _serialisation_convertion(operation)
-    assert operation3 == operation
-
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set([0]))
+    assert(operation.involved_qubits == {0})
+
 
+@pytest.mark.parametrize("init", [
+    (ops.PragmaDamping, dict(qubit=0, gate_time=1.0, rate=0.5)),
+    (ops.PragmaDepolarise, dict(qubit=0, gate_time=1.0, rate=0.5)),
+    (ops.PragmaDephasing, dict(qubit=0, gate_time=1.0, rate=0.5)),
+    (ops.PragmaRandomNoise, dict(qubit=0, gate_time=1.0, depolarisation_rate=0.5,
+                                 dephasing_rate=0.25)),
+])
+def test_pragma_power_scaling(init):
+    """Test the power of a noise PRAGMA scales its gate time"""
+    op, kwargs = init
+    operation = op(**kwargs)
     operation2 = operation**1.5
     assert operation2._ordered_parameter_dict['gate_time'].isclose(
         1.5 * operation._ordered_parameter_dict['gate_time'])
 
 
-@pytest.mark.parametrize("gate_time", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("rate", list(np.arange(0, 2 * np.pi, 2 * np.pi / 3)))
-@pytest.mark.parametrize("operators", [
-    np.array([[0, 3, 1], [2, 0, 0], [0, 0, 1]]),
-    np.array([[2, 1, 4], [0, 2, 0], [1, 6, 7]]),
-    np.array([[0, 0, 0], [2, 4, 6], [0, 5, 0]]),
+@pytest.mark.parametrize("gate_time, rate", _GRID3_PAIRS, ids=_grid_id)
+@pytest.mark.parametrize("operator_rows", [
+    ((0, 3, 1), (2, 0, 0), (0, 0, 1)),
+    ((2, 1, 4), (0, 2, 0), (1, 6, 7)),
+    ((0, 0, 0), (2, 4, 6), (0, 5, 0)),
 ])
-def test_general_noise_operator(gate_time, rate, operators):
+def test_general_noise_operator(gate_time, rate, operator_rows):
     """Test PRAGMA operators applying general noise"""
+    operators = np.array(operator_rows)
     op = ops.PragmaGeneralNoise
     string = 'PragmaGeneralNoise(gate_time, rate, operators) 0'
 
@@ -117,20 +119,14 @@ def test_general_noise_operator(gate_time, rate, operators):
 
     operation = op(qubit=q0, gate_time=gate_time, rate=rate, operators=operators)
     substitution_dict = {'gate_time': gate_time, 'rate': rate}
-    calculator = Calculator()
-    for name, val in substitution_dict.items():
-        calculator.set(name, val)
 
     operation.substitute_parameters(substitution_dict)
 
-    operation3 = _serialisation_convertion(operation)
-    assert operation3 == operation
-
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set([0]))
+    assert(operation.involved_qubits == {0})
 
-    operation.remap_qubits({0: 2})
-    assert operation.involved_qubits == set([2])
+    operation.remap_qubits(_MAP_0_2)
+    assert operation.involved_qubits == {2}
     assert operation._qubit == 2
 
     assert operation != ops.PragmaStop()
@@ -140,20 +136,36 @@ def test_general_noise_operator(gate_time, rate, operators):
     assert operation != op(0, gate_time, rate, operators)
 
 
+@pytest.mark.parametrize("init", [
+    (ops.PragmaDamping, dict(qubit=0, gate_time=1.0, rate=0.5)),
+    (ops.PragmaDepolarise, dict(qubit=0, gate_time=1.0, rate=0.5)),
+    (ops.PragmaDephasing, dict(qubit=0, gate_time=1.0, rate=0.5)),
+    (ops.PragmaRandomNoise, dict(qubit=0, gate_time=1.0, depolarisation_rate=0.5,
+                                 dephasing_rate=0.25)),
+    (ops.PragmaGeneralNoise, dict(qubit=0, gate_time=1.0, rate=0.5,
+                                  operators=np.array([[0, 3, 1], [2, 0, 0], [0, 0, 1]]))),
+])
+def test_serialisation_schema(init, dict_roundtrip):
+    """Test serialisation of the noise PRAGMAs once per class instead of once per sweep point"""
+    op, kwargs = init
+    operation = op(**kwargs)
+    operation3 = dict_roundtrip(operation)
+    assert operation3 == operation
+
+
 @pytest.mark.parametrize("init", [
     ops.PragmaDamping, ops.PragmaDepolarise, ops.PragmaDephasing, ops.PragmaRandomNoise
 ])
-def test_remap_qubits_single_qubit_gates(init):
+def test_remap_qubits_single_qubit_gates(init, dict_roundtrip):
     """Test remap qubits function of noise PRAGMAs"""
     gate = init()
-    qubit_mapping = {0: 2}
     new_gate = copy(gate)
-    new_gate.remap_qubits(qubit_mapping)
+    new_gate.remap_qubits(_MAP_0_2)
     for key, val in gate._ordered_qubits_dict.items():
         assert new_gate._ordered_qubits_dict[key] == val + 2
-    assert new_gate.involved_qubits == set([2])
+    assert new_gate.involved_qubits == {2}
 
-    new_gate2 = _serialisation_convertion(new_gate)
+    new_gate2 = dict_roundtrip(new_gate)
     assert new_gate2 == new_gate
 
 
@@ -176,7 +188,7 @@ def test_set_number_measurements_pragma(backend):
 
 
 
-def test_repeat_pragma():
+def test_repeat_pragma(dict_roundtrip):
     """Test PRAGMA repeating a certain gate"""
     op = ops.PragmaRepeatGate
     Coefficient = 'coefficient'
@@ -187,18 +199,14 @@ def test_repeat_pragma():
 
     operation.substitute_parameters({'coefficient': 2})
 
-    operation3 = _serialisation_convertion(operation)
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set(['ALL']))
+    assert(operation.involved_qubits == {'ALL'})
 
 
-@pytest.mark.parametrize("init", [(ops.PragmaDamping),
-                                  (ops.PragmaDepolarise),
-                                  (ops.PragmaDephasing)
-                                  ])
-def test_noise_boost_pragma(init):
+def test_noise_boost_pragma(dict_roundtrip):
     """Test PRAGMA boosting noise in the circuit"""
     op = ops.PragmaBoostNoise
     Coefficient = 'coefficient'
@@ -209,7 +217,7 @@ def test_noise_boost_pragma(init):
 
     operation.substitute_parameters({'coefficient': 2})
 
-    operation3 = _serialisation_convertion(operation)
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
     assert(not operation.is_parametrized)
@@ -227,7 +235,7 @@ def test_noise_boost_pragma(init):
                                    )
                                   ])
 @pytest.mark.parametrize("stype", ['static', "statistic"])
-def test_overrotation_pragma(init, stype):
+def test_overrotation_pragma(init, stype, dict_roundtrip):
     """Test PRAGMA for the overrotation of a gate"""
     op = ops.PragmaOverrotation
     (Theta0, Variance, Mean) = ('theta0', 'variance', 'mean')
@@ -251,16 +259,16 @@ def test_overrotation_pragma(init, stype):
     assert(operation.to_hqs_lang() == string)
     assert(operation.is_parametrized)
 
-    operation3 = _serialisation_convertion(operation)
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
     if init[0] in ['W', 'RotateZ']:
-        assert(operation.involved_qubits == set([q0]))
+        assert(operation.involved_qubits == {q0})
     else:
-        assert(set(operation.involved_qubits) == set([q0, q1]))
+        assert(set(operation.involved_qubits) == {q0, q1})
 
 
-def test_remap_qubits_overrotations():
+def test_remap_qubits_overrotations(dict_roundtrip):
     """Test remap qubits function of overrotation PRAGMA"""
     operation = ops.PragmaOverrotation(gate='RotateZ',
                                        statistic_type='static',
@@ -269,61 +277,60 @@ def test_remap_qubits_overrotations():
                                        overrotation_parameter='test',
                                        variance=0,
                                        mean=0)
-    mapping = {0: 2}
-    operation.remap_qubits(mapping)
+    operation.remap_qubits(_MAP_0_2)
     assert operation._ordered_qubits_dict['qubit'] == 2
 
-    operation3 = _serialisation_convertion(operation)
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
 
-def test_stop_pragma():
+def test_stop_pragma(dict_roundtrip):
     """Test STOP pragma"""
     op = ops.PragmaStop
     string = "PragmaStop ALL"
     operation = op()
     assert(operation.to_hqs_lang() == string)
     assert(not operation.is_parametrized)
-    assert(operation.involved_qubits == set(['ALL']))
+    assert(operation.involved_qubits == {'ALL'})
 
-    operation3 = _serialisation_convertion(operation)
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
     string = "PragmaStop 1"
     Q1 = 1
 
     operation = op(qubits=[Q1])
-    assert(operation.involved_qubits == set([Q1]))
+    assert(operation.involved_qubits == {Q1})
     assert(operation.to_hqs_lang() == string)
 
-    operation3 = _serialisation_convertion(operation)
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
     string = "PragmaStop(0.001) 1"
     Q1 = 1
 
     operation = op(qubits=[Q1], execution_time=0.001)
-    assert(operation.involved_qubits == set([Q1]))
+    assert(operation.involved_qubits == {Q1})
     assert(operation.to_hqs_lang() == string)
 
-    operation3 = _serialisation_convertion(operation)
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
 
 @pytest.mark.parametrize("gate", [ops.PragmaStop,
-                                  ops.PragmaSleep])
-def test_remap_qubits_stop(gate):
-    """Test remap qubits function of STOP PRAGMA"""
+                                  ops.PragmaSleep,
+                                  ops.PragmaStartDecompositionBlock,
+                                  ops.PragmaStopDecompositionBlock])
+def test_remap_qubits_stop(gate, dict_roundtrip):
+    """Test remap qubits function of STOP, sleep and decomposition block PRAGMAs"""
     operation = gate(qubits=[0, 1])
-    mapping = {0: 2, 1: 3}
-    operation.remap_qubits(mapping)
-    assert operation.involved_qubits == set([2, 3])
-    operation = ops.PragmaStop()
-    mapping = {0: 2, 1: 3}
-    operation.remap_qubits(mapping)
-    assert operation.involved_qubits == set(['ALL'])
-
-    operation3 = _serialisation_convertion(operation)
+    operation.remap_qubits(_MAP_02_13)
+    assert operation.involved_qubits == {2, 3}
+    operation = gate()
+    operation.remap_qubits(_MAP_02_13)
+    assert operation.involved_qubits == {'ALL'}
+
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
 
@@ -335,7 +342,7 @@ def test_remap_qubits_stop(gate):
                                       'PragmaParameterSubstitution test=0.1;'
                                       ),
                                      ])
-def test_stop_parameter_substitution(initial):
+def test_stop_parameter_substitution(initial, dict_roundtrip):
     """Test parameter substitution function of STOP PRAGMA"""
     gate = ops.PragmaParameterSubstitution(substitution_dict=initial[0])
     assert gate._substitution_dict == initial[1]
@@ -347,11 +354,11 @@ def test_stop_parameter_substitution(initial):
     assert test_string == initial[2]
     assert gate.backend_instruction() is None
 
-    gate2 = _serialisation_convertion(gate)
+    gate2 = dict_roundtrip(gate)
     assert gate2 == gate
 
 
-def test_global_phase_pragma():
+def test_global_phase_pragma(dict_roundtrip):
     """Test global phase PRAGMA"""
     gate = ops.PragmaGlobalPhase(phase="test")
     assert gate.to_hqs_lang() == "PragmaGlobalPhase test"
@@ -361,94 +368,57 @@ def test_global_phase_pragma():
     assert not gate.is_parametrized
     assert gate.phase == 0.1
 
-    gate2 = _serialisation_convertion(gate)
+    gate2 = dict_roundtrip(gate)
     assert gate2 == gate
 
 
-def test_start_decomposition_block_pragma():
-    """Test PragmaStartDecompositionBlock PRAGMA"""
-    op = ops.PragmaStartDecompositionBlock
-
-    string = "PragmaStartDecompositionBlock(None) ALL"
-    operation = op()
-    assert(operation.to_hqs_lang() == string)
-    assert(operation.involved_qubits == set(['ALL']))
-    operation3 = _serialisation_convertion(operation)
-    assert operation3 == operation
-
-    string = "PragmaStartDecompositionBlock(None) 1"
-    Q1 = 1
-    operation = op(qubits=[Q1])
-    assert(operation.involved_qubits == set([Q1]))
-    assert(operation.to_hqs_lang() == string)
-    operation3 = _serialisation_convertion(operation)
-    assert operation3 == operation
-
-    string = "PragmaStartDecompositionBlock({1: 2, 0: 1}) 0 1 2"
-    Q1 = [0, 1, 2]
-    operation = op(qubits=Q1, reordering_dictionary={1: 2, 0: 1})
-    assert(operation.involved_qubits == set(Q1))
-    assert(operation.to_hqs_lang() == string)
-    operation3 = _serialisation_convertion(operation)
-    assert operation3 == operation
-
-
-def test_stop_decomposition_block_pragma():
-    """Test PragmaStopDecompositionBlock PRAGMA"""
-    op = ops.PragmaStopDecompositionBlock
-
-    string = "PragmaStopDecompositionBlock ALL"
-    operation = op()
-    assert(operation.to_hqs_lang() == string)
-    assert(operation.involved_qubits == set(['ALL']))
-    operation3 = _serialisation_convertion(operation)
-    assert operation3 == operation
-
-    string = "PragmaStopDecompositionBlock 1"
-    Q1 = 1
-    operation = op(qubits=[Q1])
-    assert(operation.involved_qubits == set([Q1]))
+@pytest.mark.parametrize("init", [
+    (ops.PragmaStartDecompositionBlock, dict(),
+     "PragmaStartDecompositionBlock(None) ALL", {'ALL'}),
+    (ops.PragmaStartDecompositionBlock, dict(qubits=[1]),
+     "PragmaStartDecompositionBlock(None) 1", {1}),
+    (ops.PragmaStartDecompositionBlock, dict(qubits=[0, 1, 2], reordering_dictionary={1: 2, 0: 1}),
+     "PragmaStartDecompositionBlock({1: 2, 0: 1}) 0 1 2", {0, 1, 2}),
+    (ops.PragmaStopDecompositionBlock, dict(),
+     "PragmaStopDecompositionBlock ALL", {'ALL'}),
+    (ops.PragmaStopDecompositionBlock, dict(qubits=[1]),
+     "PragmaStopDecompositionBlock 1", {1}),
+])
+def test_decomposition_block_pragma(init, dict_roundtrip):
+    """Test PragmaStartDecompositionBlock and PragmaStopDecompositionBlock PRAGMAs"""
+    op, kwargs, string, qubits = init
+    operation = op(**kwargs)
     assert(operation.to_hqs_lang() == string)
-    operation3 = _serialisation_convertion(operation)
-    assert operation3 == operation
-
-
-@pytest.mark.parametrize("gate", [ops.PragmaStartDecompositionBlock,
-                                  ops.PragmaStopDecompositionBlock])
-def test_remap_qubits_stop(gate):
-    """Test remap qubits function of Decomposition block PRAGMAs"""
-    operation = gate(qubits=[0, 1])
-    mapping = {0: 2, 1: 3}
-    operation.remap_qubits(mapping)
-    assert operation.involved_qubits == set([2, 3])
-    operation = ops.PragmaStop()
-    mapping = {0: 2, 1: 3}
-    operation.remap_qubits(mapping)
-    assert operation.involved_qubits == set(['ALL'])
-
-    operation3 = _serialisation_convertion(operation)
+    assert(operation.involved_qubits == qubits)
+    operation3 = dict_roundtrip(operation)
     assert operation3 == operation
 
 
-def _serialisation_convertion(to_conv):
-    """Convertion function for all serialisation unittests
-
-    Takes the object input, serialises and deserialises it, returning the deserialised
-    version. The original object and the manipulated one are then compared in the unittest
-    script to assert that the serialisation worked correctly.
-
-    Args:
-        to_conv: object to be serialised and deserialised
-
-    Returns:
-        Any: deserialised object
-    """
-    config = to_conv.to_qonfig()
-    json = config.to_json()
-    config2 = Qonfig.from_json(json)
-    converted = config2.to_instance()
-
-    return converted
+@pytest.mark.parametrize("operation", [
+    ops.PragmaSetNumberOfMeasurements(number_measurements=10, readout='ro'),
+    ops.PragmaDamping(qubit=0, gate_time=0.5, rate=0.1),
+    ops.PragmaDepolarise(qubit=0, gate_time=0.5, rate=0.1),
+    ops.PragmaDephasing(qubit=0, gate_time=0.5, rate=0.1),
+    ops.PragmaRandomNoise(qubit=0, gate_time=0.5, depolarisation_rate=0.1, dephasing_rate=0.2),
+    ops.PragmaGeneralNoise(qubit=0, gate_time=0.5, rate=0.1,
+                           operators=np.array([[0, 3, 1], [2, 0, 0], [0, 0, 1]])),
+    ops.PragmaRepeatGate(repetition_coefficient=2),
+    ops.PragmaBoostNoise(noise_coefficient='coefficient'),
+    ops.PragmaOverrotation(gate='ControlledPhaseShift', statistic_type='statistic',
+                           ordered_qubits_dict={'control': 0, 'qubit': 1}, parameter='theta',
+                           overrotation_parameter='test', variance=0.1, mean=0),
+    ops.PragmaStop(qubits=[1], execution_time=0.001),
+    ops.PragmaGlobalPhase(phase='test'),
+    ops.PragmaParameterSubstitution(substitution_dict={'test': 0.1}),
+    ops.PragmaSleep(qubits=[0, 1], execution_time=0.5),
+    ops.PragmaActiveReset(qubit=0),
+    ops.PragmaStartDecompositionBlock(qubits=[0, 1, 2], reordering_dictionary={1: 2, 0: 1}),
+    ops.PragmaStopDecompositionBlock(qubits=[1]),
+], ids=lambda operation: type(operation).__name__)
+def test_json_roundtrip(operation, roundtrip):
+    """Test serialisation through the json representation of the Qonfig once per class"""
+    operation2 = roundtrip(operation)
+    assert operation2 == operation
 
 
 if __name__ == '__main__':
@@ -0,0 +1,188 @@
+# Copyright © 2019-2021 HQS Quantum Simulations GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied. See the License for the specific language governing permissions and limitations under
+# the License.
+"""Testing the qoqo classical registers"""
+
+import pytest
+import sys
+import numpy as np
+import numpy.testing as npt
+from qoqo import operations as ops
+from qoqo import registers
+
+
+@pytest.mark.parametrize("init", [
+    (registers.BitRegister, 'bit', [True, False, True]),
+    (registers.FloatRegister, 'float', [0.5, 1.0, -2.0]),
+    (registers.ComplexRegister, 'complex', [0.5j, 1.0, -2.0 + 1j]),
+])
+def test_write_batch(init):
+    """Test writing several values into a register at once"""
+    register_type, vartype, values = init
+    register = register_type(ops.Definition(name='ro', vartype=vartype, length=5))
+    register.write_batch([0, 2, 4], values)
+    content = register.register
+    expected = np.zeros((5,), dtype=content.dtype)
+    expected[[0, 2, 4]] = values
+    npt.assert_array_equal(content, expected)
+
+    register.reset()
+    npt.assert_array_equal(register.register, np.zeros((5,), dtype=content.dtype))
+
+    with pytest.raises(ValueError):
+        register.write_batch([0, 1], values)
+    with pytest.raises(IndexError):
+        register.write_batch([0, 2, 5], values)
+    with pytest.raises(IndexError):
+        register.write_batch([-1, 2, 4], values)
+
+
+@pytest.mark.parametrize("init", [
+    (registers.BitRegister, 'bit', [True, False, True]),
+    (registers.FloatRegister, 'float', [0.5, 1.0, -2.0]),
+    (registers.ComplexRegister, 'complex', [0.5j, 1.0, -2.0 + 1j]),
+])
+def test_write_batch_jit(init):
+    """Test the numba compiled register write rejects indices out of range"""
+    pytest.importorskip('numba')
+    from qoqo.registers import _kernels
+    assert hasattr(_kernels.write_register, 'py_func')
+    register_type, vartype, values = init
+    register = register_type(ops.Definition(name='ro', vartype=vartype, length=5))
+    register.write_batch([0, 2, 4], values)
+    npt.assert_array_equal(register.register[[0, 2, 4]], values)
+
+    with pytest.raises(IndexError):
+        register.write_batch([0, 2, 5], values)
+    with pytest.raises(IndexError):
+        register.write_batch([-1, 2, 4], values)
+    npt.assert_array_equal(register.register[[0, 2, 4]], values)
+
+
+def test_bit_register_indexing_and_to_packed():
+    """Test bit access by index on the bool register and its conversion with to_packed"""
+    register = registers.BitRegister(ops.Definition(name='ro', vartype='bit', length=11))
+    assert register.register.dtype == bool
+    assert register.register.shape == (11,)
+    assert len(register) == 11
+
+    register[0] = True
+    register[9] = True
+    register[-1] = True
+    assert register[0]
+    assert not register[1]
+    assert register[9]
+    assert register[10]
+    packed = register.to_packed()
+    assert packed.dtype == np.uint8
+    npt.assert_array_equal(packed, np.array([1, 6], dtype=np.uint8))
+
+    register[9] = False
+    assert not register[9]
+    npt.assert_array_equal(register.to_bool_array(),
+                           [True] + [False] * 9 + [True])
+    with pytest.raises(IndexError):
+        register[11] = True
+    with pytest.raises(IndexError):
+        register[-12]
+
+    output = registers.BitRegisterOutput(
+        ops.Definition(name='ro', vartype='bit', length=11, is_output=True))
+    output.append(register)
+    npt.assert_array_equal(output.register[0], register.register)
+
+
+@pytest.mark.parametrize("init", [
+    (registers.BitRegister, registers.BitRegisterOutput, 'bit'),
+    (registers.FloatRegister, registers.FloatRegisterOutput, 'float'),
+    (registers.ComplexRegister, registers.ComplexRegisterOutput, 'complex'),
+])
+def test_register_slots(init):
+    """Test registers and output registers only store their fixed attributes"""
+    register_type, output_type, vartype = init
+    definition = ops.Definition(name='ro', vartype=vartype, length=2, is_output=True)
+    register = register_type(definition)
+    output = output_type(definition)
+    assert not hasattr(register, '__dict__')
+    assert not hasattr(output, '__dict__')
+    with pytest.raises(AttributeError):
+        register.not_an_attribute = 0
+    output.append(register)
+    assert len(output) == 1
+
+
+@pytest.mark.parametrize("init", [
+    (registers.BitRegister, 'bit', [True, False]),
+    (registers.FloatRegister, 'float', [0.5, -1.0]),
+    (registers.ComplexRegister, 'complex', [0.5j, 1.0]),
+])
+def test_preallocated_output_register(init):
+    """Test writing shots into a preallocated output register"""
+    register_type, vartype, values = init
+    definition = ops.Definition(name='ro', vartype=vartype, length=2, is_output=True)
+    register_dict = dict()
+    output_dict = dict()
+    registers.add_register(register_dict, output_dict, definition, expected_shots=3)
+    register = register_dict['ro']
+    output = output_dict['ro']
+    assert output.register.shape == (0, 2)
+    assert len(output) == 0
+
+    register.write_batch([0, 1], values)
+    output.append(register)
+    assert len(output) == 1
+    assert output.register.shape == (1, 2)
+    npt.assert_array_equal(output.register[0], values)
+    output.write(2, register)
+    assert len(output) == 3
+    assert output.register.shape == (3, 2)
+    npt.assert_array_equal(output.register[2], values)
+    assert not output.register[1].any()
+
+    with pytest.raises(IndexError):
+        output.append(register)
+    with pytest.raises(TypeError):
+        output.extend(register)
+
+    registers.add_register(register_dict, output_dict, definition)
+    assert output_dict['ro'].register == []
+    with pytest.raises(TypeError):
+        output_dict['ro'].write(0, register)
+
+
+def test_register_store():
+    """Test storing registers grouped by vartype"""
+    store = registers.RegisterStore()
+    store.add(ops.Definition(name='ro', vartype='bit', length=2, is_output=True))
+    store.add(ops.Definition(name='fl', vartype='float', length=3))
+    store.add(ops.Definition(name='co', vartype='complex', length=4, is_output=True))
+    assert set(store.bit.keys()) == {'ro'}
+    assert set(store.float.keys()) == {'fl'}
+    assert set(store.complex.keys()) == {'co'}
+    assert store.meta == {'ro': ('bit', 2, True),
+                          'fl': ('float', 3, False),
+                          'co': ('complex', 4, True)}
+    assert 'ro' in store
+    assert 'not_a_register' not in store
+    assert store['ro'].dtype == bool
+    assert store['fl'].shape == (3,)
+
+    store['ro'][1] = True
+    store['fl'][0] = 0.5
+    store['co'][3] = 1j
+    store.reset()
+    assert not store['ro'].any()
+    assert not store['fl'].any()
+    assert not store['co'].any()
+
+
+if __name__ == '__main__':
+    pytest.main(sys.argv)